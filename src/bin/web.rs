@@ -51,6 +51,12 @@ struct SessionSnapshot {
     max_turns: usize,
 }
 
+/// JSONL 会话文件的首行头部：只存元数据，消息逐行跟在后面
+#[derive(serde::Serialize, serde::Deserialize)]
+struct SessionHeader {
+    max_turns: usize,
+}
+
 /// 群聊消息（含发送者标识）
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
 struct GroupChatMessage {
@@ -110,7 +116,10 @@ struct CreateObservationParsed {
 
 /// 从 create 工具 Observation preview 解析 id、role
 fn parse_create_observation(preview: &str) -> Option<CreateObservationParsed> {
-    let re = regex::Regex::new(r"id=([a-zA-Z0-9_-]+),\s*role=([^.]+)").ok()?;
+    // 正则编译一次缓存复用，每条 Observation 事件都会走这里
+    static CREATE_OBS_RE: std::sync::OnceLock<regex::Regex> = std::sync::OnceLock::new();
+    let re = CREATE_OBS_RE
+        .get_or_init(|| regex::Regex::new(r"id=([a-zA-Z0-9_-]+),\s*role=([^.]+)").unwrap());
     let cap = re.captures(preview)?;
     let id = cap.get(1)?.as_str().to_string();
     let role = cap.get(2)?.as_str().trim().to_string();
@@ -151,12 +160,21 @@ struct AppState {
     /// 可切换模型：列表与 id -> 模型配置
     models: Vec<ModelInfo>,
     model_configs: HashMap<String, ModelEntry>,
+    /// 按模型 id 缓存的 LlmClient：每次请求重建客户端等于重建整个 HTTP
+    /// 连接池（TCP/TLS 握手无法复用），缓存后跨请求保持连接热
+    model_llm_cache: Arc<RwLock<HashMap<String, Arc<dyn bee::llm::LlmClient>>>>,
     /// 技能加载器
     skill_loader: Arc<SkillLoader>,
     /// 群组：id -> GroupInfo
     groups: Arc<RwLock<HashMap<String, GroupInfo>>>,
     /// 群组持久化路径
     groups_path: PathBuf,
+    /// 任务列表：内存为权威状态，写操作 write-through 到 tasks.json，
+    /// 读接口不再每次重读整个文件
+    tasks: Arc<RwLock<Vec<Task>>>,
+    /// 会话列表缓存：path -> (mtime, 列表项)。列表接口只对 mtime
+    /// 变化的文件重新解析，未变的直接复用，避免每次全量读盘+反序列化
+    session_list_cache: Arc<RwLock<HashMap<PathBuf, (std::time::SystemTime, SessionListItem)>>>,
     /// 拓扑事件广播（SSE /api/events）
     event_bus: broadcast::Sender<String>,
 }
@@ -299,7 +317,7 @@ struct ClearSessionRequest {
 }
 
 /// 会话列表项
-#[derive(Debug, Serialize)]
+#[derive(Debug, Clone, Serialize)]
 struct SessionListItem {
     /// 复合 key：{session_id}::{assistant_id}，用于 API 调用
     id: String,
@@ -460,8 +478,9 @@ fn load_skills_overrides(config_base: &std::path::Path) -> HashMap<String, Vec<S
         std::path::Path::new("../config/assistant_skills.json").to_path_buf(),
     ];
     for p in &paths {
-        if let Ok(s) = std::fs::read_to_string(p) {
-            if let Ok(m) = serde_json::from_str(&s) {
+        // 按 bytes 读取并解析，省去 UTF-8 校验与 String 中转
+        if let Ok(data) = std::fs::read(p) {
+            if let Ok(m) = serde_json::from_slice(&data) {
                 return m;
             }
         }
@@ -622,28 +641,29 @@ fn load_assistants(
 /// 从 workspace/agents.json 加载动态创建的 sub-agent（Phase 3）
 fn load_dynamic_agents(workspace: &std::path::Path) -> Vec<DynamicAgent> {
     let path = workspace.join("agents.json");
-    let data = match std::fs::read_to_string(&path) {
+    let data = match std::fs::read(&path) {
         Ok(d) => d,
         Err(_) => return Vec::new(),
     };
-    serde_json::from_str(&data).unwrap_or_default()
+    serde_json::from_slice(&data).unwrap_or_default()
 }
 
 const TASKS_FILE: &str = "tasks.json";
 
 fn load_tasks(workspace: &std::path::Path) -> Vec<Task> {
     let path = workspace.join(TASKS_FILE);
-    let data = match std::fs::read_to_string(&path) {
+    let data = match std::fs::read(&path) {
         Ok(d) => d,
         Err(_) => return Vec::new(),
     };
-    serde_json::from_str(&data).unwrap_or_default()
+    serde_json::from_slice(&data).unwrap_or_default()
 }
 
 fn save_tasks(workspace: &std::path::Path, tasks: &[Task]) {
     std::fs::create_dir_all(workspace).ok();
     let path = workspace.join(TASKS_FILE);
-    if let Ok(json) = serde_json::to_string_pretty(tasks) {
+    // tasks.json 仅由程序读取，紧凑编码省去 pretty 缩进的体积与格式化成本
+    if let Ok(json) = serde_json::to_vec(tasks) {
         let _ = std::fs::write(path, json);
     }
 }
@@ -755,6 +775,23 @@ fn create_llm_for_model(entry: &ModelEntry) -> Arc<dyn bee::llm::LlmClient> {
     ))
 }
 
+/// 取缓存的模型客户端；首次使用时创建并放入缓存，之后复用同一实例
+async fn llm_for_model(
+    cache: &RwLock<HashMap<String, Arc<dyn bee::llm::LlmClient>>>,
+    model_id: &str,
+    entry: &ModelEntry,
+) -> Arc<dyn bee::llm::LlmClient> {
+    if let Some(llm) = cache.read().await.get(model_id) {
+        return Arc::clone(llm);
+    }
+    let mut cache = cache.write().await;
+    Arc::clone(
+        cache
+            .entry(model_id.to_string())
+            .or_insert_with(|| create_llm_for_model(entry)),
+    )
+}
+
 #[tokio::main]
 async fn main() -> anyhow::Result<()> {
     tracing_subscriber::registry()
@@ -847,6 +884,7 @@ async fn main() -> anyhow::Result<()> {
 
     let groups_path = workspace.join("groups.json");
     let groups = load_groups_from_disk(&groups_path);
+    let tasks = Arc::new(RwLock::new(load_tasks(&workspace)));
     let (event_bus, _) = broadcast::channel::<String>(64);
 
     let state = Arc::new(AppState {
@@ -865,9 +903,12 @@ async fn main() -> anyhow::Result<()> {
         config_base,
         models,
         model_configs,
+        model_llm_cache: Arc::new(RwLock::new(HashMap::new())),
+        session_list_cache: Arc::new(RwLock::new(HashMap::new())),
         skill_loader,
         groups,
         groups_path,
+        tasks,
         event_bus,
     });
 
@@ -921,6 +962,12 @@ async fn main() -> anyhow::Result<()> {
                     tracing::info!("memory consolidated: {} days, {} blocks", r.dates_processed.len(), r.blocks_added);
                 }
             }
+            // 归纳完成后回收超期原始日志，控制磁盘占用与目录规模
+            if let Ok(n) = bee::memory::markdown_store::cleanup_old_daily_logs(&memory_root_periodic, 30) {
+                if n > 0 {
+                    tracing::info!("cleaned up {} old daily logs", n);
+                }
+            }
         }
     });
 
@@ -998,10 +1045,15 @@ async fn serve_metrics_dashboard() -> Html<&'static str> {
     Html(include_str!("../../static/metrics.html"))
 }
 
+/// 编译期打进二进制的第三方库不会变，让浏览器长期缓存，
+/// 每个页面加载省掉几百 KB 的重复传输
+const STATIC_ASSET_CACHE: &str = "public, max-age=86400, immutable";
+
 async fn serve_marked_js() -> Response {
     Response::builder()
         .status(StatusCode::OK)
         .header(header::CONTENT_TYPE, "application/javascript; charset=utf-8")
+        .header(header::CACHE_CONTROL, STATIC_ASSET_CACHE)
         .body(Body::from(include_str!("../../static/js/marked.min.js")))
         .unwrap()
 }
@@ -1010,6 +1062,7 @@ async fn serve_highlight_js() -> Response {
     Response::builder()
         .status(StatusCode::OK)
         .header(header::CONTENT_TYPE, "application/javascript; charset=utf-8")
+        .header(header::CACHE_CONTROL, STATIC_ASSET_CACHE)
         .body(Body::from(include_str!("../../static/js/highlight.min.js")))
         .unwrap()
 }
@@ -1018,6 +1071,7 @@ async fn serve_highlight_css() -> Response {
     Response::builder()
         .status(StatusCode::OK)
         .header(header::CONTENT_TYPE, "text/css; charset=utf-8")
+        .header(header::CACHE_CONTROL, STATIC_ASSET_CACHE)
         .body(Body::from(include_str!("../../static/css/github-dark.min.css")))
         .unwrap()
 }
@@ -1051,15 +1105,15 @@ fn session_path(sessions_dir: &std::path::Path, session_id: &str, assistant_id:
 }
 
 fn load_groups_from_disk(path: &std::path::Path) -> Arc<RwLock<HashMap<String, GroupInfo>>> {
-    let map: HashMap<String, GroupInfo> = std::fs::read_to_string(path)
+    let map: HashMap<String, GroupInfo> = std::fs::read(path)
         .ok()
-        .and_then(|s| serde_json::from_str(&s).ok())
+        .and_then(|data| serde_json::from_slice(&data).ok())
         .unwrap_or_default();
     Arc::new(RwLock::new(map))
 }
 
 fn save_groups_to_disk(path: &std::path::Path, groups: &HashMap<String, GroupInfo>) {
-    if let Ok(json) = serde_json::to_string_pretty(groups) {
+    if let Ok(json) = serde_json::to_vec(groups) {
         let _ = std::fs::write(path, json);
     }
 }
@@ -1070,9 +1124,9 @@ fn load_group_session(
     group_id: &str,
 ) -> Vec<GroupChatMessage> {
     let path = group_session_path(sessions_dir, group_id);
-    std::fs::read_to_string(&path)
+    std::fs::read(&path)
         .ok()
-        .and_then(|s| serde_json::from_str::<GroupChatSnapshot>(&s).ok())
+        .and_then(|data| serde_json::from_slice::<GroupChatSnapshot>(&data).ok())
         .map(|snap| snap.messages)
         .unwrap_or_default()
 }
@@ -1089,7 +1143,7 @@ fn save_group_session(
         messages: messages.to_vec(),
         max_turns,
     };
-    if let Ok(json) = serde_json::to_string_pretty(&snap) {
+    if let Ok(json) = serde_json::to_vec(&snap) {
         let _ = std::fs::write(path, json);
     }
 }
@@ -1157,7 +1211,7 @@ fn load_session_from_disk(
             None
         }
     })?;
-    let snap: SessionSnapshot = serde_json::from_str(&data).ok()?;
+    let snap = parse_session_snapshot(&data)?;
     let conversation = ConversationMemory::from_messages(snap.messages, snap.max_turns);
     let assistant_root = assistant_memory_root(workspace, assistant_id);
     std::fs::create_dir_all(&assistant_root).ok();
@@ -1189,19 +1243,90 @@ fn save_session_to_disk(
     context: &ContextManager,
 ) {
     let path = session_path(sessions_dir, session_id, assistant_id);
-    let snap = SessionSnapshot {
-        messages: context.messages().to_vec(),
-        max_turns: context.conversation.max_turns(),
-    };
-    if let Ok(json) = serde_json::to_string_pretty(&snap) {
-        let _ = std::fs::write(path, json);
-    }
+    let _ = write_session_snapshot(&path, context.messages(), context.conversation.max_turns());
     let assistant_root = assistant_memory_root(workspace, assistant_id);
     std::fs::create_dir_all(assistant_root.join("logs")).ok();
-    let date = chrono::Local::now().format("%Y-%m-%d").to_string();
+    let date = bee::memory::today_str();
     let _ = append_daily_log(&assistant_root, &date, &format!("{}:{}", session_id, assistant_id), context.messages());
 }
 
+/// 解析会话文件：优先按旧版整块 JSON 快照解析，失败则按 JSONL
+/// （首行 SessionHeader + 每行一条消息）流式解析
+fn parse_session_snapshot(data: &str) -> Option<SessionSnapshot> {
+    if let Ok(snap) = serde_json::from_str::<SessionSnapshot>(data) {
+        return Some(snap);
+    }
+    let mut lines = data.lines().filter(|l| !l.trim().is_empty());
+    let header: SessionHeader = serde_json::from_str(lines.next()?).ok()?;
+    let messages = lines
+        .filter_map(|l| serde_json::from_str::<Message>(l).ok())
+        .collect();
+    Some(SessionSnapshot {
+        messages,
+        max_turns: header.max_turns,
+    })
+}
+
+/// 以追加方式持久化会话（JSONL）：每轮只写新增消息，写入成本从
+/// O(历史总量) 降到 O(本轮)。旧版整块快照在下次保存时整体转写；
+/// 仅当文件确为内存的前缀时才追加——光比数量不够：达到 max_turns 上限后
+/// 历史是长度恒定的滑动窗口，轮内压缩也可能先缩后涨回原数量，这两种情况
+/// 下末条内容已对不上，需整体重写以保持文件与内存一致
+fn write_session_snapshot(
+    path: &std::path::Path,
+    messages: &[Message],
+    max_turns: usize,
+) -> std::io::Result<()> {
+    use std::io::Write;
+
+    let existing = std::fs::read(path).unwrap_or_default();
+    // JSONL 头部由紧凑序列化产生，前缀固定；旧版 pretty JSON 以 "{\n" 开头
+    let is_jsonl = existing.starts_with(b"{\"max_turns\"");
+    if is_jsonl {
+        let mut lines = existing
+            .split(|&b| b == b'\n')
+            .filter(|l| !l.iter().all(u8::is_ascii_whitespace))
+            .skip(1); // 头部行
+        let mut persisted = 0usize;
+        let mut last_line: &[u8] = &[];
+        for l in &mut lines {
+            persisted += 1;
+            last_line = l;
+        }
+        // 末条持久化内容与 messages[persisted-1] 的序列化逐字节一致才算前缀命中
+        let is_prefix = persisted <= messages.len()
+            && (persisted == 0
+                || serde_json::to_vec(&messages[persisted - 1])
+                    .map(|b| b == last_line)
+                    .unwrap_or(false));
+        if is_prefix {
+            let mut buf = Vec::new();
+            for m in &messages[persisted..] {
+                serde_json::to_writer(&mut buf, m)
+                    .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
+                buf.push(b'\n');
+            }
+            if !buf.is_empty() {
+                std::fs::OpenOptions::new()
+                    .create(true)
+                    .append(true)
+                    .open(path)?
+                    .write_all(&buf)?;
+            }
+            return Ok(());
+        }
+    }
+    let mut buf = serde_json::to_vec(&SessionHeader { max_turns })
+        .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
+    buf.push(b'\n');
+    for m in messages {
+        serde_json::to_writer(&mut buf, m)
+            .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
+        buf.push(b'\n');
+    }
+    std::fs::write(path, buf)
+}
+
 /// POST /api/memory/consolidate?since_days=7：手动触发记忆整理（截断式），将近期短期日志归纳写入长期记忆
 async fn api_memory_consolidate(
     State(state): State<Arc<AppState>>,
@@ -1333,6 +1458,8 @@ async fn api_sessions_list(
     let entries = std::fs::read_dir(&state.sessions_dir)
         .map_err(|e| (StatusCode::INTERNAL_SERVER_ERROR, e.to_string()))?;
 
+    let mut cache = state.session_list_cache.write().await;
+    let mut seen: Vec<PathBuf> = Vec::new();
     for entry in entries.flatten() {
         let path = entry.path();
         if path.extension().map_or(true, |e| e != "json") {
@@ -1345,6 +1472,15 @@ async fn api_sessions_list(
         if stem.is_empty() {
             continue;
         }
+        seen.push(path.clone());
+        // mtime 未变则复用缓存项，跳过整个文件的读取与反序列化
+        let mtime = entry.metadata().and_then(|m| m.modified()).ok();
+        if let (Some(mtime), Some((cached_mtime, item))) = (mtime, cache.get(&path)) {
+            if *cached_mtime == mtime {
+                items.push(item.clone());
+                continue;
+            }
+        }
         let (session_id, assistant_id) = if let Some(idx) = stem.find("---") {
             let (sid, aid) = stem.split_at(idx);
             (sid.to_string(), aid.trim_start_matches("---").to_string())
@@ -1357,9 +1493,9 @@ async fn api_sessions_list(
             Ok(c) => c,
             Err(_) => continue,
         };
-        let snap: SessionSnapshot = match serde_json::from_str(&content) {
-            Ok(s) => s,
-            Err(_) => continue,
+        let snap = match parse_session_snapshot(&content) {
+            Some(s) => s,
+            None => continue,
         };
 
         let title = snap
@@ -1391,7 +1527,7 @@ async fn api_sessions_list(
             })
             .unwrap_or_else(|_| (String::new(), String::new()));
 
-        items.push(SessionListItem {
+        let item = SessionListItem {
             id: id.clone(),
             session_id,
             assistant_id,
@@ -1399,8 +1535,15 @@ async fn api_sessions_list(
             message_count: snap.messages.len(),
             updated_at,
             date,
-        });
+        };
+        if let Some(mtime) = mtime {
+            cache.insert(path, (mtime, item.clone()));
+        }
+        items.push(item);
     }
+    // 清掉已被删除的会话对应的缓存项
+    cache.retain(|p, _| seen.contains(p));
+    drop(cache);
 
     items.sort_by(|a, b| b.date.cmp(&a.date).then(b.updated_at.cmp(&a.updated_at)));
 
@@ -1527,7 +1670,7 @@ async fn api_tasks_list(
     State(state): State<Arc<AppState>>,
     Query(query): Query<std::collections::HashMap<String, String>>,
 ) -> Result<Json<Vec<Task>>, (StatusCode, String)> {
-    let tasks = load_tasks(&state.workspace);
+    let tasks = state.tasks.read().await.clone();
     let status_filter = query.get("status").and_then(|s| {
         match s.as_str() {
             "todo" => Some(TaskStatus::Todo),
@@ -1598,9 +1741,11 @@ async fn api_tasks_create(
         created_at: now.clone(),
         updated_at: now.clone(),
     };
-    let mut tasks = load_tasks(&state.workspace);
-    tasks.push(task.clone());
-    save_tasks(&state.workspace, &tasks);
+    {
+        let mut tasks = state.tasks.write().await;
+        tasks.push(task.clone());
+        save_tasks(&state.workspace, &tasks);
+    }
     emit_event(&state.event_bus, WorkspaceEvent::TaskCreated {
         id: task.id.clone(),
         title: task.title.clone(),
@@ -1614,7 +1759,7 @@ async fn api_tasks_update(
     Path(task_id): Path<String>,
     Json(req): Json<UpdateTaskRequest>,
 ) -> Result<Json<Task>, (StatusCode, String)> {
-    let mut tasks = load_tasks(&state.workspace);
+    let mut tasks = state.tasks.write().await;
     let pos = tasks.iter().position(|t| t.id == task_id);
     let task = match pos {
         Some(i) => &mut tasks[i],
@@ -1641,6 +1786,7 @@ async fn api_tasks_update(
     task.updated_at = chrono::Utc::now().to_rfc3339();
     let task = task.clone();
     save_tasks(&state.workspace, &tasks);
+    drop(tasks);
     let status_str = match task.status {
         TaskStatus::Todo => "todo",
         TaskStatus::InProgress => "in_progress",
@@ -1662,8 +1808,10 @@ async fn api_tasks_start(
     Path(task_id): Path<String>,
 ) -> Result<Response, (StatusCode, String)> {
     reload_dynamic_agents_into_state(&state).await;
-    let tasks = load_tasks(&state.workspace);
-    let task = tasks
+    let task = state
+        .tasks
+        .read()
+        .await
         .iter()
         .find(|t| t.id == task_id)
         .cloned()
@@ -1723,7 +1871,7 @@ async fn api_tasks_start(
             &coordinator_id_clone,
             &context,
         );
-        let mut tasks = load_tasks(&state_spawn.workspace);
+        let mut tasks = state_spawn.tasks.write().await;
         let task_updated = tasks.iter_mut().find(|x| x.id == task_id_clone).map(|t| {
             t.status = TaskStatus::InProgress;
             t.updated_at = chrono::Utc::now().to_rfc3339();
@@ -1731,6 +1879,7 @@ async fn api_tasks_start(
         });
         if let Some(id) = task_updated {
             save_tasks(&state_spawn.workspace, &tasks);
+            drop(tasks);
             emit_event(&state_spawn.event_bus, WorkspaceEvent::TaskUpdated {
                 id,
                 status: "in_progress".to_string(),
@@ -1767,7 +1916,13 @@ async fn api_tasks_start(
             }
             match event_rx.recv().await {
                 Some(ev) => {
-                    let line = format!("{}\n", serde_json::to_string(&ev).unwrap());
+                    // 把通道里已积压的事件并入同一个 HTTP chunk：
+                    // 逐 token 的 delta 不再各占一个 chunk/syscall，且不增加延迟
+                    let mut line = format!("{}\n", serde_json::to_string(&ev).unwrap());
+                    use std::fmt::Write as _;
+                    while let Ok(ev) = event_rx.try_recv() {
+                        let _ = writeln!(line, "{}", serde_json::to_string(&ev).unwrap());
+                    }
                     Some((Ok::<_, std::convert::Infallible>(Bytes::from(line)), (state, event_rx, vec![])))
                 }
                 None => None,
@@ -2474,9 +2629,13 @@ async fn api_chat_stream_group(
 
     type BoxErr = Box<dyn std::error::Error + Send + Sync>;
     let stream = stream::unfold(line_rx, |mut rx| async move {
-        rx.recv()
-            .await
-            .map(|line| (Ok::<Bytes, BoxErr>(Bytes::from(line)), rx))
+        rx.recv().await.map(|mut line| {
+            // 合并通道中已积压的行，减少每 token 一个 chunk 的发送开销
+            while let Ok(next) = rx.try_recv() {
+                line.push_str(&next);
+            }
+            (Ok::<Bytes, BoxErr>(Bytes::from(line)), rx)
+        })
     });
     let mut res = Response::new(Body::from_stream(stream));
     res.headers_mut().insert(
@@ -2563,13 +2722,17 @@ async fn api_chat_stream(
         let mut ctx = context;
         let prompt_ref = system_prompt_override.as_deref();
         let planner_override: Option<Arc<Planner>> = if model_id != "default" {
-            model_configs.get(&model_id).map(|entry| {
-                let llm = create_llm_for_model(entry);
-                let sys = prompt_ref
-                    .unwrap_or_else(|| components.planner.base_system_prompt())
-                    .to_string();
-                Arc::new(Planner::new(llm, sys))
-            })
+            match model_configs.get(&model_id) {
+                Some(entry) => {
+                    let llm =
+                        llm_for_model(&state_spawn.model_llm_cache, &model_id, entry).await;
+                    let sys = prompt_ref
+                        .unwrap_or_else(|| components.planner.base_system_prompt())
+                        .to_string();
+                    Some(Arc::new(Planner::new(llm, sys)))
+                }
+                None => None,
+            }
         } else {
             None
         };
@@ -2640,31 +2803,39 @@ async fn api_chat_stream(
             }
             match event_rx.recv().await {
                 Some(ev) => {
-                    // 自我改进：工具失败 → ERRORS.md；Critic 纠正 → LEARNINGS.md (correction)
-                    match &ev {
-                        ReactEvent::ToolFailure { tool, reason } => {
-                            learnings_record_error(&state_reinsert.workspace, tool, reason);
-                        }
-                        ReactEvent::Recovery { action, detail } if action == "Critic" => {
-                            learnings_record_learning(
-                                &state_reinsert.workspace,
-                                "correction",
-                                detail,
-                                None,
-                            );
-                        }
-                        ReactEvent::Observation { tool, preview } if tool == "create" => {
-                            if let Some(agent) = parse_create_observation(preview) {
-                                emit_event(&state_reinsert.event_bus, WorkspaceEvent::AgentCreated {
-                                    id: agent.id,
-                                    role: agent.role,
-                                    parent_id: agent.parent_id,
-                                });
+                    // 把通道里已积压的事件并入同一个 HTTP chunk，逐 token 的
+                    // delta 不再各占一个 chunk/syscall；无积压时行为与逐条发送一致
+                    use std::fmt::Write as _;
+                    let mut line = String::new();
+                    let mut next = Some(ev);
+                    while let Some(ev) = next {
+                        // 自我改进：工具失败 → ERRORS.md；Critic 纠正 → LEARNINGS.md (correction)
+                        match &ev {
+                            ReactEvent::ToolFailure { tool, reason } => {
+                                learnings_record_error(&state_reinsert.workspace, tool, reason);
+                            }
+                            ReactEvent::Recovery { action, detail } if action == "Critic" => {
+                                learnings_record_learning(
+                                    &state_reinsert.workspace,
+                                    "correction",
+                                    detail,
+                                    None,
+                                );
+                            }
+                            ReactEvent::Observation { tool, preview } if tool == "create" => {
+                                if let Some(agent) = parse_create_observation(preview) {
+                                    emit_event(&state_reinsert.event_bus, WorkspaceEvent::AgentCreated {
+                                        id: agent.id,
+                                        role: agent.role,
+                                        parent_id: agent.parent_id,
+                                    });
+                                }
                             }
+                            _ => {}
                         }
-                        _ => {}
+                        let _ = writeln!(line, "{}", serde_json::to_string(&ev).unwrap());
+                        next = event_rx.try_recv().ok();
                     }
-                    let line = format!("{}\n", serde_json::to_string(&ev).unwrap());
                     Ok(Some((
                         Bytes::from(line),
                         (state_reinsert, session_id_reinsert, context_rx, event_rx, None),
@@ -200,12 +200,19 @@ impl SelfAnalyzer {
     }
 
     fn calculate_metrics(&self, content: &str) -> CodeMetrics {
-        let lines_of_code = content.lines().count();
+        // 总行数与注释行数在同一次遍历里统计，内容只扫一遍
+        let (lines_of_code, comment_count) =
+            content
+                .lines()
+                .fold((0usize, 0usize), |(total, comments), l| {
+                    if l.trim().starts_with("//") {
+                        (total + 1, comments + 1)
+                    } else {
+                        (total + 1, comments)
+                    }
+                });
+
 
-        let comment_count = content.lines()
-            .filter(|l| l.trim().starts_with("//"))
-            .count();
-        
         let documentation_coverage = if lines_of_code > 0 {
             Some(comment_count as f64 / lines_of_code as f64)
         } else {
@@ -272,12 +279,16 @@ impl SelfAnalyzer {
             priority: Priority::Medium,
         };
 
-        let error_count = analysis.issues.iter()
-            .filter(|i| matches!(i.severity, Severity::Error))
-            .count();
-        let warning_count = analysis.issues.iter()
-            .filter(|i| matches!(i.severity, Severity::Warning))
-            .count();
+        // 单次遍历同时统计 error/warning，避免对 issues 扫两遍
+        let (error_count, warning_count) =
+            analysis
+                .issues
+                .iter()
+                .fold((0usize, 0usize), |(errs, warns), i| match i.severity {
+                    Severity::Error => (errs + 1, warns),
+                    Severity::Warning => (errs, warns + 1),
+                    _ => (errs, warns),
+                });
 
         if error_count > 0 {
             plan.improvement_type = ImprovementType::BugFix;
@@ -1,4 +1,4 @@
-use std::time::{SystemTime, Duration};
+use std::time::{Duration, Instant, SystemTime};
 
 use chrono;
 
@@ -9,7 +9,9 @@ pub struct EvolutionEngine {
     iteration_count: usize,
     last_run_time: Option<SystemTime>,
     iterations_in_current_period: usize,
-    last_failure_time: Option<SystemTime>,
+    /// 失败冷却只关心「距上次失败过了多久」，用单调时钟计量：
+    /// 墙钟（SystemTime）会因 NTP 校时/手动改时间跳变，令冷却提前结束或卡死
+    last_failure_time: Option<Instant>,
 }
 
 #[derive(Clone)]
@@ -102,10 +104,8 @@ impl EvolutionEngine {
         // 检查冷却时间
         if let Some(last_failure) = self.last_failure_time {
             let cooldown_duration = Duration::from_secs(self.config.cooldown_seconds);
-            if let Ok(elapsed) = last_failure.elapsed() {
-                if elapsed < cooldown_duration {
-                    return false;
-                }
+            if last_failure.elapsed() < cooldown_duration {
+                return false;
             }
         }
 
@@ -236,7 +236,7 @@ impl EvolutionEngine {
     }
 
     pub fn record_failed_run(&mut self) {
-        self.last_failure_time = Some(SystemTime::now());
+        self.last_failure_time = Some(Instant::now());
     }
 
     pub fn reset_period_if_needed(&mut self) {
@@ -254,9 +254,7 @@ impl EvolutionEngine {
     pub fn is_in_cooldown(&self) -> bool {
         if let Some(last_failure) = self.last_failure_time {
             let cooldown_duration = Duration::from_secs(self.config.cooldown_seconds);
-            if let Ok(elapsed) = last_failure.elapsed() {
-                return elapsed < cooldown_duration;
-            }
+            return last_failure.elapsed() < cooldown_duration;
         }
         false
     }
@@ -63,12 +63,30 @@ impl Default for HubConfig {
     }
 }
 
+/// 每个客户端发送队列的容量：无界队列会让一个卡死的慢客户端
+/// 无限堆积内存；队列满时丢弃新消息，保护其余客户端与服务端内存
+const CLIENT_SEND_QUEUE_SIZE: usize = 1024;
+
 /// WebSocket 连接
 #[allow(dead_code)]
 struct Connection {
     client_info: ClientInfo,
     session_id: String,
-    tx: mpsc::UnboundedSender<String>,
+    /// 队列元素为 Arc<str>：广播同一负载给 N 个客户端时入队只是
+    /// 引用计数 +1，不再为每个客户端复制整个字符串
+    tx: mpsc::Sender<Arc<str>>,
+}
+
+/// 向客户端队列投递消息：队列满（慢客户端）时丢弃并记日志，
+/// 绝不阻塞调用方；连接已关闭时静默忽略
+fn queue_send(tx: &mpsc::Sender<Arc<str>>, msg: Arc<str>) {
+    match tx.try_send(msg) {
+        Ok(()) => {}
+        Err(mpsc::error::TrySendError::Full(_)) => {
+            tracing::warn!("Client send queue full, dropping message");
+        }
+        Err(mpsc::error::TrySendError::Closed(_)) => {}
+    }
 }
 
 /// Hub（轮毂/中枢）- 核心运行时
@@ -79,6 +97,9 @@ pub struct Hub {
     #[allow(dead_code)]
     intent_recognizer: Arc<IntentRecognizer>,
     connections: Arc<RwLock<HashMap<String, Connection>>>,
+    /// session_id -> client_ids 索引：按会话广播时直接定位目标连接，
+    /// 不必每次线性扫描全部连接
+    session_index: Arc<RwLock<HashMap<String, Vec<String>>>>,
     spokes: Arc<RwLock<Vec<Arc<dyn SpokeAdapter>>>>,
     shutdown: tokio::sync::watch::Sender<bool>,
     /// 后台任务队列
@@ -146,6 +167,7 @@ impl Hub {
             runtime,
             intent_recognizer,
             connections: Arc::new(RwLock::new(HashMap::new())),
+            session_index: Arc::new(RwLock::new(HashMap::new())),
             spokes: Arc::new(RwLock::new(Vec::new())),
             shutdown: shutdown_tx,
             task_queue: Arc::new(task_queue),
@@ -175,8 +197,10 @@ impl Hub {
 
         let mut shutdown_rx = self.shutdown.subscribe();
         let connections = Arc::clone(&self.connections);
+        let session_index = Arc::clone(&self.session_index);
         let session_store = Arc::clone(&self.session_store);
         let runtime = Arc::clone(&self.runtime);
+        let task_queue = Arc::clone(&self.task_queue);
         let heartbeat_interval = self.config.heartbeat_interval;
 
         tokio::spawn(async move {
@@ -195,11 +219,23 @@ impl Hub {
                         if expired > 0 {
                             tracing::info!("Cleaned up {} expired sessions", expired);
                         }
+                        // 任务表若不清理会随进程生命周期无限增长：
+                        // 定期移除完成超过 24h 的任务（内存 + 数据库同步删除）
+                        let removed = task_queue.cleanup_old_tasks(24).await;
+                        if removed > 0 {
+                            tracing::info!("Cleaned up {} finished background tasks", removed);
+                        }
                     }
                     result = listener.accept() => {
                         match result {
                             Ok((stream, addr)) => {
+                                // 小帧高频的 WebSocket 流量下，Nagle 合并会给每条
+                                // 消息加最高 ~40ms 的延迟；关闭后立即发包
+                                if let Err(e) = stream.set_nodelay(true) {
+                                    tracing::debug!("set_nodelay failed for {}: {}", addr, e);
+                                }
                                 let connections = Arc::clone(&connections);
+                                let session_index = Arc::clone(&session_index);
                                 let session_store = Arc::clone(&session_store);
                                 let runtime = Arc::clone(&runtime);
 
@@ -208,6 +244,7 @@ impl Hub {
                                         stream,
                                         addr,
                                         connections,
+                                        session_index,
                                         session_store,
                                         runtime,
                                         heartbeat_interval,
@@ -237,6 +274,7 @@ impl Hub {
         }
 
         self.connections.write().await.clear();
+        self.session_index.write().await.clear();
     }
 
     /// 向指定客户端发送消息
@@ -246,7 +284,7 @@ impl Hub {
             let json = serde_json::to_string(&message)
                 .map_err(|e| format!("Serialize error: {}", e))?;
             conn.tx
-                .send(json)
+                .try_send(json.into())
                 .map_err(|e| format!("Send error: {}", e))?;
             Ok(())
         } else {
@@ -256,15 +294,19 @@ impl Hub {
 
     /// 向会话的所有客户端广播消息
     pub async fn broadcast_to_session(&self, session_id: &str, message: GatewayMessage) {
-        let connections = self.connections.read().await;
-        let json = match serde_json::to_string(&message) {
-            Ok(j) => j,
+        let json: Arc<str> = match serde_json::to_string(&message) {
+            Ok(j) => j.into(),
             Err(_) => return,
         };
 
-        for conn in connections.values() {
-            if conn.session_id == session_id {
-                let _ = conn.tx.send(json.clone());
+        let index = self.session_index.read().await;
+        let Some(client_ids) = index.get(session_id) else {
+            return;
+        };
+        let connections = self.connections.read().await;
+        for client_id in client_ids {
+            if let Some(conn) = connections.get(client_id) {
+                queue_send(&conn.tx, Arc::clone(&json));
             }
         }
     }
@@ -312,11 +354,15 @@ impl Hub {
                         },
                     );
 
+                    // 序列化一次、多路分发：同一负载发给 N 个客户端时
+                    // 不必为每个连接重复跑一遍 serde
+                    let json: Arc<str> = match serde_json::to_string(&msg) {
+                        Ok(j) => j.into(),
+                        Err(_) => continue,
+                    };
                     let connections = connections.read().await;
                     for conn in connections.values() {
-                        if let Ok(json) = serde_json::to_string(&msg) {
-                            let _ = conn.tx.send(json);
-                        }
+                        queue_send(&conn.tx, Arc::clone(&json));
                     }
                 }
             });
@@ -343,6 +389,7 @@ async fn handle_connection(
     stream: TcpStream,
     addr: SocketAddr,
     connections: Arc<RwLock<HashMap<String, Connection>>>,
+    session_index: Arc<RwLock<HashMap<String, Vec<String>>>>,
     session_store: Arc<dyn SessionStore>,
     runtime: Arc<AgentRuntime>,
     _heartbeat_interval: u64,
@@ -352,7 +399,7 @@ async fn handle_connection(
         .map_err(|e| format!("WebSocket handshake failed: {}", e))?;
 
     let (mut ws_tx, mut ws_rx) = ws_stream.split();
-    let (tx, mut rx) = mpsc::unbounded_channel::<String>();
+    let (tx, mut rx) = mpsc::channel::<Arc<str>>(CLIENT_SEND_QUEUE_SIZE);
 
     let client_id = format!("ws_{}_{}", addr, uuid::Uuid::new_v4());
     let mut session_id: Option<String> = None;
@@ -362,7 +409,9 @@ async fn handle_connection(
 
     tokio::spawn(async move {
         while let Some(msg) = rx.recv().await {
-            if ws_tx.send(WsMessage::Text(msg)).await.is_err() {
+            // tungstenite 需要 owned String，这里才做唯一一次复制，
+            // 且发生在各自客户端的写任务里，不占用广播方的时间
+            if ws_tx.send(WsMessage::Text(msg.to_string())).await.is_err() {
                 break;
             }
         }
@@ -377,13 +426,27 @@ async fn handle_connection(
             }
         };
 
+        // 二进制帧按同样的 JSON 协议处理：客户端可发 Binary 帧
+        // 省去 WebSocket 文本帧的 UTF-8 校验路径，服务端在这里统一归一
+        let msg = match msg {
+            WsMessage::Binary(bin) => match String::from_utf8(bin) {
+                Ok(s) => WsMessage::Text(s),
+                Err(e) => {
+                    let error = GatewayMessage::error("parse_error", &e.to_string());
+                    queue_send(&tx, serde_json::to_string(&error).unwrap_or_default().into());
+                    continue;
+                }
+            },
+            other => other,
+        };
+
         match msg {
             WsMessage::Text(text) => {
                 let gateway_msg: GatewayMessage = match serde_json::from_str(&text) {
                     Ok(m) => m,
                     Err(e) => {
                         let error = GatewayMessage::error("parse_error", &e.to_string());
-                        let _ = tx.send(serde_json::to_string(&error).unwrap_or_default());
+                        queue_send(&tx, serde_json::to_string(&error).unwrap_or_default().into());
                         continue;
                     }
                 };
@@ -394,7 +457,7 @@ async fn handle_connection(
                             .get_or_create(&info.client_id, info.clone())
                             .await;
 
-                        session_id = Some(sid.clone());
+                        let prev_sid = session_id.replace(sid.clone());
                         client_info = Some(info.clone());
 
                         connections.write().await.insert(
@@ -405,6 +468,24 @@ async fn handle_connection(
                                 tx: tx.clone(),
                             },
                         );
+                        {
+                            let mut index = session_index.write().await;
+                            // 重复 Auth 切换会话时摘掉旧会话下的登记，否则旧条目
+                            // 既会继续收到旧会话广播，断连清理也只认最后一个 sid
+                            if let Some(prev) = prev_sid.filter(|p| p != &sid) {
+                                if let Some(ids) = index.get_mut(&prev) {
+                                    ids.retain(|id| id != &client_id);
+                                    if ids.is_empty() {
+                                        index.remove(&prev);
+                                    }
+                                }
+                            }
+                            let ids = index.entry(sid.clone()).or_default();
+                            // 同一连接重复 Auth 不重复登记，避免广播双份投递
+                            if !ids.contains(&client_id) {
+                                ids.push(client_id.clone());
+                            }
+                        }
 
                         let response = GatewayMessage::new(
                             Some(sid.clone()),
@@ -414,7 +495,7 @@ async fn handle_connection(
                                 message: None,
                             },
                         );
-                        let _ = tx.send(serde_json::to_string(&response).unwrap_or_default());
+                        queue_send(&tx, serde_json::to_string(&response).unwrap_or_default().into());
                     }
 
                     MessageType::UserMessage {
@@ -426,7 +507,7 @@ async fn handle_connection(
                             Some(s) => s.clone(),
                             None => {
                                 let error = GatewayMessage::error("not_authenticated", "Please authenticate first");
-                                let _ = tx.send(serde_json::to_string(&error).unwrap_or_default());
+                                queue_send(&tx, serde_json::to_string(&error).unwrap_or_default().into());
                                 continue;
                             }
                         };
@@ -437,7 +518,9 @@ async fn handle_connection(
                         tokio::spawn(async move {
                             while let Some(msg) = response_rx.recv().await {
                                 let json = serde_json::to_string(&msg).unwrap_or_default();
-                                if tx_for_response.send(json).is_err() {
+                                // 智能体回复对本客户端有序且重要：这里用带背压的
+                                // 异步 send 等待队列腾出位置，连接关闭才退出
+                                if tx_for_response.send(json.into()).await.is_err() {
                                     break;
                                 }
                             }
@@ -479,13 +562,13 @@ async fn handle_connection(
                                 Some(sid.clone()),
                                 MessageType::History { messages },
                             );
-                            let _ = tx.send(serde_json::to_string(&response).unwrap_or_default());
+                            queue_send(&tx, serde_json::to_string(&response).unwrap_or_default().into());
                         }
                     }
 
                     MessageType::Ping { timestamp } => {
                         let pong = GatewayMessage::pong(timestamp);
-                        let _ = tx.send(serde_json::to_string(&pong).unwrap_or_default());
+                        queue_send(&tx, serde_json::to_string(&pong).unwrap_or_default().into());
                     }
 
                     _ => {}
@@ -501,6 +584,15 @@ async fn handle_connection(
     }
 
     connections.write().await.remove(&client_id);
+    if let Some(sid) = &session_id {
+        let mut index = session_index.write().await;
+        if let Some(ids) = index.get_mut(sid) {
+            ids.retain(|id| id != &client_id);
+            if ids.is_empty() {
+                index.remove(sid);
+            }
+        }
+    }
 
     if let (Some(sid), Some(info)) = (&session_id, &client_info) {
         session_store.remove_client(sid, info.platform).await;
@@ -42,11 +42,19 @@ impl PersistentSessionManager {
         max_context_turns: usize,
         session_timeout_secs: u64,
     ) -> Result<Self, sqlx::Error> {
-        let db_url = format!("sqlite:{}?mode=rwc", db_path.as_ref().display());
-        
+        // 每条池内连接都带上 WAL + synchronous=NORMAL：写不阻塞读，fsync 移出提交关键路径
+        let options = sqlx::sqlite::SqliteConnectOptions::new()
+            .filename(db_path.as_ref())
+            .create_if_missing(true)
+            .journal_mode(sqlx::sqlite::SqliteJournalMode::Wal)
+            .synchronous(sqlx::sqlite::SqliteSynchronous::Normal)
+            .pragma("temp_store", "MEMORY")
+            .pragma("mmap_size", "268435456")
+            .pragma("cache_size", "-65536");
+
         let pool = sqlx::sqlite::SqlitePoolOptions::new()
             .max_connections(5)
-            .connect(&db_url)
+            .connect_with(options)
             .await?;
         
         let manager = Self {
@@ -198,6 +206,8 @@ impl PersistentSessionManager {
         };
         let now = chrono::Utc::now().to_rfc3339();
 
+        // 两条语句包进同一事务，单次 commit/fsync 落盘
+        let mut tx = self.pool.begin().await?;
         sqlx::query(
             "INSERT INTO gateway_messages (session_id, role, content, created_at) VALUES (?, ?, ?, ?)"
         )
@@ -205,14 +215,15 @@ impl PersistentSessionManager {
         .bind(role_str)
         .bind(&message.content)
         .bind(&now)
-        .execute(&self.pool)
+        .execute(&mut *tx)
         .await?;
 
         sqlx::query("UPDATE gateway_sessions SET updated_at = ? WHERE id = ?")
             .bind(&now)
             .bind(session_id)
-            .execute(&self.pool)
+            .execute(&mut *tx)
             .await?;
+        tx.commit().await?;
 
         Ok(())
     }
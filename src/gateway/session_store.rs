@@ -130,7 +130,7 @@ impl SessionStore for MemorySessionStore {
             } else {
                 messages
             };
-            limited.iter().map(|m| (format!("{:?}", m.role), m.content.clone())).collect()
+            limited.iter().map(|m| (m.role.as_str().to_string(), m.content.clone())).collect()
         }).await.unwrap_or_default()
     }
 }
@@ -214,7 +214,7 @@ impl SessionStore for PersistentSessionStore {
             } else {
                 messages
             };
-            limited.iter().map(|m| (format!("{:?}", m.role), m.content.clone())).collect()
+            limited.iter().map(|m| (m.role.as_str().to_string(), m.content.clone())).collect()
         }).await.unwrap_or_default()
     }
 }
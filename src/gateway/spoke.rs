@@ -32,28 +32,6 @@ pub trait SpokeAdapter: Send + Sync {
 // 通讯端点（Communication Spokes）
 // ============================================================================
 
-/// 通讯端点类型
-#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
-#[serde(rename_all = "snake_case")]
-pub enum CommunicationSpokeType {
-    /// Web 浏览器（WebSocket）
-    Web,
-    /// 终端 TUI
-    Tui,
-    /// Telegram
-    Telegram,
-    /// Slack
-    Slack,
-    /// WhatsApp
-    WhatsApp,
-    /// Discord
-    Discord,
-    /// 飞书 Lark
-    Lark,
-    /// HTTP API
-    Api,
-}
-
 /// 通讯端点 trait
 #[async_trait]
 pub trait CommunicationSpoke: SpokeAdapter {
@@ -166,11 +166,19 @@ impl TaskQueue {
     pub async fn with_persistence(
         db_path: impl AsRef<Path>,
     ) -> Result<(Self, mpsc::UnboundedReceiver<TaskId>, mpsc::UnboundedReceiver<TaskNotification>), sqlx::Error> {
-        let db_url = format!("sqlite:{}?mode=rwc", db_path.as_ref().display());
-        
+        // 每条池内连接都带上 WAL + synchronous=NORMAL：写不阻塞读，fsync 移出提交关键路径
+        let options = sqlx::sqlite::SqliteConnectOptions::new()
+            .filename(db_path.as_ref())
+            .create_if_missing(true)
+            .journal_mode(sqlx::sqlite::SqliteJournalMode::Wal)
+            .synchronous(sqlx::sqlite::SqliteSynchronous::Normal)
+            .pragma("temp_store", "MEMORY")
+            .pragma("mmap_size", "268435456")
+            .pragma("cache_size", "-65536");
+
         let pool = sqlx::sqlite::SqlitePoolOptions::new()
             .max_connections(3)
-            .connect(&db_url)
+            .connect_with(options)
             .await?;
         
         sqlx::query(
@@ -200,6 +208,14 @@ impl TaskQueue {
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_tasks_status ON background_tasks(status)")
             .execute(&pool)
             .await?;
+        // 覆盖恢复查询 WHERE status IN (...) ORDER BY priority DESC, created_at：
+        // 复合索引让查询走索引序直接输出，免去全表扫描 + 排序
+        sqlx::query(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_priority
+             ON background_tasks(status, priority DESC, created_at ASC)",
+        )
+        .execute(&pool)
+        .await?;
 
         let (pending_tx, pending_rx) = mpsc::unbounded_channel();
         let (notification_tx, notification_rx) = mpsc::unbounded_channel();
@@ -475,12 +491,23 @@ impl TaskQueue {
     }
 
     /// 获取用户待处理的任务
+    ///
+    /// 先过滤再克隆：任务的 result/metadata 可能很大，
+    /// 已完成的任务不必为了马上丢弃而整份复制一遍
     pub async fn get_pending_tasks(&self, user_id: &str) -> Vec<BackgroundTask> {
-        self.get_user_tasks(user_id)
-            .await
-            .into_iter()
-            .filter(|t| !t.is_finished())
-            .collect()
+        let tasks = self.tasks.read().await;
+        let user_tasks = self.user_tasks.read().await;
+
+        user_tasks
+            .get(user_id)
+            .map(|ids| {
+                ids.iter()
+                    .filter_map(|id| tasks.get(id))
+                    .filter(|t| !t.is_finished())
+                    .cloned()
+                    .collect()
+            })
+            .unwrap_or_default()
     }
 
     /// 取消任务
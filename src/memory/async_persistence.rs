@@ -20,11 +20,20 @@ mod sqlx_impl {
     impl AsyncSqlitePersistence {
         /// 创建新的异步持久化实例
         pub async fn new(db_path: impl AsRef<Path>) -> Result<Self, sqlx::Error> {
-            let db_url = format!("sqlite:{}?mode=rwc", db_path.as_ref().display());
-            
+            // 连接选项里声明 PRAGMA，连接池里每条新连接都会自动应用：
+            // WAL 写不阻塞读，synchronous=NORMAL 把 fsync 移出提交关键路径
+            let options = sqlx::sqlite::SqliteConnectOptions::new()
+                .filename(db_path.as_ref())
+                .create_if_missing(true)
+                .journal_mode(sqlx::sqlite::SqliteJournalMode::Wal)
+                .synchronous(sqlx::sqlite::SqliteSynchronous::Normal)
+                .pragma("temp_store", "MEMORY")
+                .pragma("mmap_size", "268435456")
+                .pragma("cache_size", "-65536");
+
             let pool = SqlitePoolOptions::new()
                 .max_connections(5)
-                .connect(&db_url)
+                .connect_with(options)
                 .await?;
             
             let persistence = Self { pool };
@@ -113,14 +122,12 @@ mod sqlx_impl {
             session_id: &str,
             message: &Message,
         ) -> Result<(), sqlx::Error> {
-            let role_str = match message.role {
-                Role::User => "user",
-                Role::Assistant => "assistant",
-                Role::System => "system",
-                Role::Tool => "tool",
-            };
+            let role_str = message.role.as_str();
             let now = chrono::Utc::now().to_rfc3339();
 
+            // INSERT 与 updated_at 更新合并为一个事务：每条消息一次 commit/fsync，
+            // 而不是两个隐式自动提交事务各 fsync 一次
+            let mut tx = self.pool.begin().await?;
             sqlx::query(
                 "INSERT INTO messages (session_id, role, content, created_at) VALUES (?, ?, ?, ?)"
             )
@@ -128,14 +135,15 @@ mod sqlx_impl {
             .bind(role_str)
             .bind(&message.content)
             .bind(&now)
-            .execute(&self.pool)
+            .execute(&mut *tx)
             .await?;
 
             sqlx::query("UPDATE sessions SET updated_at = ? WHERE id = ?")
                 .bind(&now)
                 .bind(session_id)
-                .execute(&self.pool)
+                .execute(&mut *tx)
                 .await?;
+            tx.commit().await?;
 
             Ok(())
         }
@@ -150,12 +158,7 @@ mod sqlx_impl {
             let now = chrono::Utc::now().to_rfc3339();
 
             for message in messages {
-                let role_str = match message.role {
-                    Role::User => "user",
-                    Role::Assistant => "assistant",
-                    Role::System => "system",
-                    Role::Tool => "tool",
-                };
+                let role_str = message.role.as_str();
 
                 sqlx::query(
                     "INSERT INTO messages (session_id, role, content, created_at) VALUES (?, ?, ?, ?)"
@@ -10,7 +10,8 @@
 use serde::{Deserialize, Serialize};
 
 /// 消息角色（与 LLM API 一致）
-#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+/// 无字段枚举派生 Copy：按值传递只拷一个判别字节，调用方无需 clone
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Serialize, Deserialize)]
 pub enum Role {
     User,
     Assistant,
@@ -19,6 +20,19 @@ pub enum Role {
     Tool,
 }
 
+impl Role {
+    /// 与 LLM API 一致的小写角色名：静态字符串，序列化/展示热路径
+    /// 无需 format!("{:?}") 那样的每次分配
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Role::User => "user",
+            Role::Assistant => "assistant",
+            Role::System => "system",
+            Role::Tool => "tool",
+        }
+    }
+}
+
 /// 单条消息
 #[derive(Clone, Debug, Serialize, Deserialize)]
 pub struct Message {
@@ -244,17 +258,17 @@ impl ConversationMemory {
         kept_indices.extend(other_msgs.iter().map(|(i, _, _)| *i));
         kept_indices.sort();
 
+        // 用布尔掩码标记保留项，避免对每条消息做 kept_indices 的线性查找（O(N²)）
+        let mut kept = vec![false; self.messages.len()];
+        for &i in &kept_indices {
+            kept[i] = true;
+        }
+
         let pruned_messages: Vec<Message> = self
             .messages
             .iter()
             .enumerate()
-            .filter_map(|(i, m)| {
-                if !kept_indices.contains(&i) {
-                    Some(m.clone())
-                } else {
-                    None
-                }
-            })
+            .filter_map(|(i, m)| if !kept[i] { Some(m.clone()) } else { None })
             .collect();
 
         let new_messages: Vec<Message> = kept_indices
@@ -276,6 +290,8 @@ impl ConversationMemory {
             return String::new();
         }
         
+        use std::fmt::Write as _;
+
         let mut summary = String::from("Pruned conversation context:\n");
         for msg in pruned {
             let role = match msg.role {
@@ -284,12 +300,12 @@ impl ConversationMemory {
                 Role::System => "System",
                 Role::Tool => "Tool",
             };
-            let content = if msg.content.len() > 100 {
-                format!("{}...", &msg.content[..100])
+            // write! 直接写入摘要缓冲，长消息截断也不再克隆内容
+            if msg.content.len() > 100 {
+                let _ = writeln!(summary, "- {}: {}...", role, &msg.content[..100]);
             } else {
-                msg.content.clone()
-            };
-            summary.push_str(&format!("- {}: {}\n", role, content));
+                let _ = writeln!(summary, "- {}: {}", role, msg.content);
+            }
         }
         summary
     }
@@ -87,16 +87,25 @@ impl LongTermMemory for InMemoryLongTerm {
             return Vec::new();
         }
         let store = self.store.read().unwrap();
-        let mut scored: Vec<(f32, String)> = store
+        // 打分阶段只记录索引，避免为每个候选克隆文本；仅 top-k 命中才克隆
+        let mut scored: Vec<(f32, usize)> = store
             .iter()
-            .map(|(text, doc_tokens)| (self.score(&query_tokens, doc_tokens), text.clone()))
+            .enumerate()
+            .map(|(i, (_, doc_tokens))| (self.score(&query_tokens, doc_tokens), i))
             .filter(|(s, _)| *s > 0.0)
             .collect();
+        // 只需要前 k 条：先线性选出 top-k 再排序，避免全量排序
+        if scored.len() > k && k > 0 {
+            scored.select_nth_unstable_by(k - 1, |a, b| {
+                b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal)
+            });
+            scored.truncate(k);
+        }
         scored.sort_by(|a, b| b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal));
         scored
             .into_iter()
             .take(k)
-            .map(|(_, t)| t)
+            .map(|(_, i)| store[i].0.clone())
             .collect()
     }
 }
@@ -113,6 +122,8 @@ pub struct InMemoryVectorLongTerm {
     embedder: Arc<dyn crate::llm::EmbeddingProvider>,
     max_entries: usize,
     snapshot_path: Option<std::path::PathBuf>,
+    /// 自上次快照以来是否有新写入；避免 flush_all/定期刷盘重写未变化的文件
+    dirty: std::sync::atomic::AtomicBool,
 }
 
 /// 快照 JSON 条目（与 vector_snapshot.json 格式一致）
@@ -122,6 +133,41 @@ struct VectorSnapshotEntry {
     embedding: Vec<f32>,
 }
 
+/// 序列化用借用视图：保存快照时直接借用 store 内容，不复制文本与嵌入向量
+#[derive(serde::Serialize)]
+struct VectorSnapshotEntryRef<'a> {
+    text: &'a str,
+    embedding: &'a [f32],
+}
+
+/// 流式写快照：borrow store 条目并经 BufWriter 直接序列化到文件。
+/// 相比先 clone 整个 store 再 to_vec 成一整块 JSON，峰值内存省掉
+/// 「条目副本 + 完整 JSON 字节」两份（嵌入向量会把这两份放大到数十 MB）
+fn write_snapshot_streaming(
+    path: &Path,
+    store: &std::sync::RwLock<Vec<(String, Vec<f32>)>>,
+) -> std::io::Result<()> {
+    use std::io::Write;
+
+    if let Some(parent) = path.parent() {
+        std::fs::create_dir_all(parent)?;
+    }
+    let file = std::fs::File::create(path)?;
+    let mut writer = std::io::BufWriter::new(file);
+    {
+        let store = store.read().unwrap();
+        let refs: Vec<VectorSnapshotEntryRef> = store
+            .iter()
+            .map(|(text, emb)| VectorSnapshotEntryRef {
+                text,
+                embedding: emb,
+            })
+            .collect();
+        serde_json::to_writer(&mut writer, &refs)?;
+    }
+    writer.flush()
+}
+
 fn cosine_similarity(a: &[f32], b: &[f32]) -> f32 {
     if a.is_empty() || b.is_empty() || a.len() != b.len() {
         return 0.0;
@@ -163,8 +209,9 @@ impl InMemoryVectorLongTerm {
         let path_buf = snapshot_path.map(|p| p.as_ref().to_path_buf());
         let store = Arc::new(std::sync::RwLock::new(Vec::new()));
         if let Some(ref path) = path_buf {
-            if let Ok(data) = std::fs::read_to_string(path) {
-                if let Ok(entries) = serde_json::from_str::<Vec<VectorSnapshotEntry>>(&data) {
+            // 按 bytes 读取并解析，快照可能包含大量嵌入向量，省去一次 String 拷贝
+            if let Ok(data) = std::fs::read(path) {
+                if let Ok(entries) = serde_json::from_slice::<Vec<VectorSnapshotEntry>>(&data) {
                     let loaded: Vec<(String, Vec<f32>)> =
                         entries.into_iter().map(|e| (e.text, e.embedding)).collect();
                     let n = loaded.len().min(max_entries);
@@ -179,51 +226,52 @@ impl InMemoryVectorLongTerm {
             embedder,
             max_entries,
             snapshot_path: path_buf,
+            dirty: std::sync::atomic::AtomicBool::new(false),
         }
     }
 
     /// 将当前 store 写入快照路径（若配置了 snapshot_path）- 同步版本
     pub fn save_snapshot(&self) {
+        if !self.dirty.load(std::sync::atomic::Ordering::Acquire) {
+            return;
+        }
         if let Some(ref path) = self.snapshot_path {
-            let store = self.store.read().unwrap();
-            let entries: Vec<VectorSnapshotEntry> = store
-                .iter()
-                .map(|(text, emb)| VectorSnapshotEntry {
-                    text: text.clone(),
-                    embedding: emb.clone(),
-                })
-                .collect();
-            drop(store);
-            if let Some(parent) = path.parent() {
-                let _ = std::fs::create_dir_all(parent);
-            }
-            if let Ok(json) = serde_json::to_string_pretty(&entries) {
-                if std::fs::write(path, json).is_ok() {
-                    tracing::debug!("vector snapshot saved to {:?}", path);
-                }
+            // 快照仅供程序加载，紧凑编码 + 流式写盘（见 write_snapshot_streaming）
+            if write_snapshot_streaming(path, &self.store).is_ok() {
+                self.dirty.store(false, std::sync::atomic::Ordering::Release);
+                tracing::debug!("vector snapshot saved to {:?}", path);
             }
         }
     }
 
     /// 将当前 store 写入快照路径（若配置了 snapshot_path）- 异步版本
     pub async fn save_snapshot_async(&self) {
-        if let Some(ref path) = self.snapshot_path {
-            let store = self.store.read().unwrap();
-            let entries: Vec<VectorSnapshotEntry> = store
-                .iter()
-                .map(|(text, emb)| VectorSnapshotEntry {
-                    text: text.clone(),
-                    embedding: emb.clone(),
-                })
-                .collect();
-            drop(store);
-            if let Some(parent) = path.parent() {
-                let _ = tokio::fs::create_dir_all(parent).await;
+        if !self.dirty.load(std::sync::atomic::Ordering::Acquire) {
+            return;
+        }
+        if let Some(path) = self.snapshot_path.clone() {
+            // 流式写盘是同步 IO，挪到阻塞线程池，避免占住 tokio worker
+            let store = self.store.clone();
+            let ok = tokio::task::spawn_blocking(move || {
+                write_snapshot_streaming(&path, &store).is_ok()
+            })
+            .await
+            .unwrap_or(false);
+            if ok {
+                self.dirty.store(false, std::sync::atomic::Ordering::Release);
+                tracing::debug!("vector snapshot saved async to {:?}", self.snapshot_path);
             }
-            if let Ok(json) = serde_json::to_string_pretty(&entries) {
-                if tokio::fs::write(path, json).await.is_ok() {
-                    tracing::debug!("vector snapshot saved async to {:?}", path);
-                }
+        }
+    }
+
+    /// 关闭前的持久化检查点：保存快照并做一次 fsync 确保落盘。
+    /// 热路径（add/定期刷盘）刻意不做 fsync——记忆快照属于可重建的遥测类数据，
+    /// 由文件系统自行调度回写即可；每次写入都 fsync 会让持久化开销反超业务本身。
+    pub fn checkpoint(&self) {
+        self.save_snapshot();
+        if let Some(ref path) = self.snapshot_path {
+            if let Ok(f) = std::fs::File::open(path) {
+                let _ = f.sync_all();
             }
         }
     }
@@ -231,8 +279,8 @@ impl InMemoryVectorLongTerm {
     /// 从快照路径加载 - 异步版本
     pub async fn load_snapshot_async(&self) {
         if let Some(ref path) = self.snapshot_path {
-            if let Ok(data) = tokio::fs::read_to_string(path).await {
-                if let Ok(entries) = serde_json::from_str::<Vec<VectorSnapshotEntry>>(&data) {
+            if let Ok(data) = tokio::fs::read(path).await {
+                if let Ok(entries) = serde_json::from_slice::<Vec<VectorSnapshotEntry>>(&data) {
                     let mut store = self.store.write().unwrap();
                     for entry in entries {
                         store.push((entry.text, entry.embedding));
@@ -258,6 +306,8 @@ impl LongTermMemory for InMemoryVectorLongTerm {
                 if n > self.max_entries {
                     store.drain(0..n - self.max_entries);
                 }
+                drop(store);
+                self.dirty.store(true, std::sync::atomic::Ordering::Release);
             }
             Ok(_) => {}
             Err(e) => tracing::warn!("vector long-term embed failed: {}", e),
@@ -274,16 +324,26 @@ impl LongTermMemory for InMemoryVectorLongTerm {
             _ => return Vec::new(),
         };
         let store = self.store.read().unwrap();
-        let mut scored: Vec<(f32, String)> = store
+        // 打分阶段只记录索引，避免为每个候选克隆文本；仅 top-k 命中才克隆
+        let mut scored: Vec<(f32, usize)> = store
             .iter()
-            .map(|(text, vec)| (cosine_similarity(&query_vec, vec), text.clone()))
+            .enumerate()
+            .map(|(i, (_, vec))| (cosine_similarity(&query_vec, vec), i))
             .filter(|(s, _)| *s > 0.0)
             .collect();
+        // 只需要前 k 条：先线性选出 top-k 再排序，避免全量排序
+        if scored.len() > k && k > 0 {
+            scored.select_nth_unstable_by(k - 1, |a, b| {
+                b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal)
+            });
+            scored.truncate(k);
+        }
         scored.sort_by(|a, b| b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal));
-        scored.into_iter().take(k).map(|(_, t)| t).collect()
+        scored.into_iter().take(k).map(|(_, i)| store[i].0.clone()).collect()
     }
 
     fn flush(&self) {
-        self.save_snapshot();
+        // flush 用于优雅关闭：做一次带 fsync 的检查点
+        self.checkpoint();
     }
 }
@@ -7,7 +7,6 @@ use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
-use crate::memory::long_term::LongTermMemory;
 use crate::memory::{Message, Role};
 
 /// 记忆根目录：memory/
@@ -30,6 +29,25 @@ pub fn daily_log_path(memory_root: &Path, date: &str) -> PathBuf {
     memory_root.join("logs").join(format!("{}.md", date))
 }
 
+/// 当天日期字符串（本地时区，YYYY-MM-DD），带 60 秒缓存。
+/// chrono 的取时+格式化涉及时区换算与多次分配，逐事件调用在热路径上
+/// 并不便宜；日期一分钟内不会变，缓存后只剩一次短字符串克隆
+pub fn today_str() -> String {
+    use std::sync::Mutex;
+    use std::time::{Duration, Instant};
+
+    static CACHE: Mutex<Option<(Instant, String)>> = Mutex::new(None);
+    let mut guard = CACHE.lock().unwrap();
+    if let Some((at, s)) = guard.as_ref() {
+        if at.elapsed() < Duration::from_secs(60) {
+            return s.clone();
+        }
+    }
+    let s = chrono::Local::now().format("%Y-%m-%d").to_string();
+    *guard = Some((Instant::now(), s.clone()));
+    s
+}
+
 /// 长期记忆文件路径：memory/long-term.md
 pub fn long_term_path(memory_root: &Path) -> PathBuf {
     memory_root.join("long-term.md")
@@ -162,94 +180,88 @@ const CONSOLIDATE_MAX_CHARS_PER_DAY: usize = 6000;
 /// - since_days：整理最近几天（含今天）；例如 7 表示最近 7 天
 /// - 每个日期对应一个块，标题为「整理 YYYY-MM-DD」，内容为当日日志摘要（截断以避免过长）
 pub fn consolidate_memory(memory_root: &Path, since_days: u32) -> std::io::Result<ConsolidateResult> {
-    let logs_dir = memory_root.join("logs");
-    if !logs_dir.exists() {
-        return Ok(ConsolidateResult::default());
-    }
-    let today = chrono::Local::now().date_naive();
-    let cutoff = today - chrono::Duration::days(since_days as i64);
+    let summaries = collect_recent_log_summaries(memory_root, since_days)?;
 
     let mut result = ConsolidateResult::default();
     let long_term_path = long_term_path(memory_root);
     let lt = FileLongTerm::new(long_term_path, 2000);
+    let mut blocks: Vec<String> = Vec::new();
 
-    let mut entries: Vec<_> = std::fs::read_dir(&logs_dir)?
-        .filter_map(|e| e.ok())
-        .filter(|e| {
-            e.path().extension().is_some_and(|ext| ext == "md")
-                && e.path().file_stem().and_then(|s| s.to_str()).is_some()
-        })
-        .collect();
-    entries.sort_by_key(|e| e.path().file_name().unwrap().to_owned());
-
-    for entry in entries {
-        let path = entry.path();
-        let stem = path.file_stem().and_then(|s| s.to_str()).unwrap_or("");
-        let date = match chrono::NaiveDate::parse_from_str(stem, "%Y-%m-%d") {
-            Ok(d) => d,
-            Err(_) => continue,
-        };
-        if date < cutoff {
-            continue;
-        }
-        let content = match std::fs::read_to_string(&path) {
-            Ok(c) => c,
-            Err(_) => continue,
-        };
-        let summary = summarize_log_content(&content);
-        if summary.is_empty() {
-            continue;
-        }
-        let block = format!("整理 {}：\n\n{}", stem, summary);
-        lt.add(&block);
-        result.dates_processed.push(stem.to_string());
+    for (stem, summary) in summaries {
+        blocks.push(format!("整理 {}：\n\n{}", stem, summary));
+        result.dates_processed.push(stem);
         result.blocks_added += 1;
     }
+    // 整批一次落盘，而不是每个日期一次 open+write
+    lt.add_all(blocks.iter().map(|b| b.as_str()));
 
     Ok(result)
 }
 
 /// 列出需整理的每日日志（since_days 内），返回 (日期, 预处理后的内容) 供 LLM 摘要
 pub fn list_daily_logs_for_llm(memory_root: &Path, since_days: u32) -> std::io::Result<Vec<(String, String)>> {
+    collect_recent_log_summaries(memory_root, since_days)
+}
+
+/// 收集 since_days 内（含今天）的每日日志摘要，按日期升序返回 (日期, 摘要)。
+/// consolidate_memory 与 list_daily_logs_for_llm 共用。
+/// 文件名即日期（YYYY-MM-DD.md），直接按日期推算出目标路径逐个尝试读取，
+/// 不必 read_dir 全目录再对每个文件名做日期解析与排序。
+fn collect_recent_log_summaries(
+    memory_root: &Path,
+    since_days: u32,
+) -> std::io::Result<Vec<(String, String)>> {
     let logs_dir = memory_root.join("logs");
     if !logs_dir.exists() {
         return Ok(Vec::new());
     }
     let today = chrono::Local::now().date_naive();
-    let cutoff = today - chrono::Duration::days(since_days as i64);
-
-    let mut entries: Vec<_> = std::fs::read_dir(&logs_dir)?
-        .filter_map(|e| e.ok())
-        .filter(|e| {
-            e.path().extension().is_some_and(|ext| ext == "md")
-                && e.path().file_stem().and_then(|s| s.to_str()).is_some()
-        })
-        .collect();
-    entries.sort_by_key(|e| e.path().file_name().unwrap().to_owned());
 
     let mut out = Vec::new();
-    for entry in entries {
-        let path = entry.path();
-        let stem = path.file_stem().and_then(|s| s.to_str()).unwrap_or("");
-        let date = match chrono::NaiveDate::parse_from_str(stem, "%Y-%m-%d") {
-            Ok(d) => d,
-            Err(_) => continue,
-        };
-        if date < cutoff {
-            continue;
-        }
-        let content = match std::fs::read_to_string(&path) {
+    for i in (0..=since_days as i64).rev() {
+        let date = today - chrono::Duration::days(i);
+        let stem = date.format("%Y-%m-%d").to_string();
+        let content = match std::fs::read_to_string(daily_log_path(memory_root, &stem)) {
             Ok(c) => c,
             Err(_) => continue,
         };
         let summary = summarize_log_content(&content);
         if !summary.is_empty() {
-            out.push((stem.to_string(), summary));
+            out.push((stem, summary));
         }
     }
     Ok(out)
 }
 
+/// 清理早于 keep_days 的每日日志，返回删除的文件数。
+/// 历史日志会随时间无限增长放大磁盘占用与启动扫描量；近期内容已由
+/// consolidate_memory 归纳进长期记忆，超期原始日志可以安全回收。
+pub fn cleanup_old_daily_logs(memory_root: &Path, keep_days: u32) -> std::io::Result<usize> {
+    let logs_dir = memory_root.join("logs");
+    if !logs_dir.exists() {
+        return Ok(0);
+    }
+    let today = chrono::Local::now().date_naive();
+    let cutoff = today - chrono::Duration::days(keep_days as i64);
+
+    let mut removed = 0;
+    for entry in std::fs::read_dir(&logs_dir)?.filter_map(|e| e.ok()) {
+        let path = entry.path();
+        if !path.extension().is_some_and(|ext| ext == "md") {
+            continue;
+        }
+        let stem = path.file_stem().and_then(|s| s.to_str()).unwrap_or("");
+        let date = match chrono::NaiveDate::parse_from_str(stem, "%Y-%m-%d") {
+            Ok(d) => d,
+            Err(_) => continue,
+        };
+        if date < cutoff && std::fs::remove_file(&path).is_ok() {
+            removed += 1;
+        }
+    }
+    Ok(removed)
+}
+
 /// 将当日日志内容做摘要：去掉 Tool call / Observation 等内部消息，保留用户与助手的实质对话，截断长度
 fn summarize_log_content(content: &str) -> String {
     let mut out = Vec::new();
@@ -282,8 +294,13 @@ pub fn append_daily_log(
     if let Some(p) = path.parent() {
         std::fs::create_dir_all(p)?;
     }
-    let mut content = String::new();
-    content.push_str(&format!("\n## Session {} ({})\n\n", session_id, date));
+    use std::fmt::Write as _;
+
+    // 预估容量 + write! 直接写入缓冲：push_str(&format!) 每条消息都要
+    // 先分配一个临时 String 再拷贝，长对话里是纯粹的分配器开销
+    let estimated: usize = messages.iter().map(|m| m.content.len() + 16).sum::<usize>() + 64;
+    let mut content = String::with_capacity(estimated);
+    let _ = write!(content, "\n## Session {} ({})\n\n", session_id, date);
     for m in messages {
         let (role, body) = match m.role {
             Role::User => ("User", m.content.as_str()),
@@ -291,7 +308,7 @@ pub fn append_daily_log(
             Role::System => ("System", m.content.as_str()),
             Role::Tool => ("Tool", m.content.as_str()),
         };
-        content.push_str(&format!("### {}\n\n{}\n\n", role, body));
+        let _ = write!(content, "### {}\n\n{}\n\n", role, body);
     }
     content.push_str("---\n\n");
     std::fs::OpenOptions::new()
@@ -319,8 +336,9 @@ fn tokenize_lower(s: &str) -> std::collections::HashSet<String> {
         .collect()
 }
 
-/// 按 Markdown 二级标题（## ...）分块；无标题时整段视为一块
-fn split_blocks(content: &str) -> Vec<String> {
+/// 按 Markdown 二级标题（## ...）分块；无标题时整段视为一块。
+/// 返回借用切片，由调用方决定为哪些块分配所有权（加载时只留尾部）
+fn split_blocks(content: &str) -> Vec<&str> {
     let content = content.trim();
     if content.is_empty() {
         return Vec::new();
@@ -337,11 +355,11 @@ fn split_blocks(content: &str) -> Vec<String> {
             block
         };
         if !text.is_empty() {
-            blocks.push(text.to_string());
+            blocks.push(text);
         }
     }
     if blocks.is_empty() {
-        blocks.push(content.to_string());
+        blocks.push(content);
     }
     blocks
 }
@@ -367,16 +385,49 @@ impl FileLongTerm {
         }
         if let Ok(content) = std::fs::read_to_string(&self.path) {
             let blocks = split_blocks(&content);
+            // 只保留尾部 max_entries 块：超限的旧块既不分配所有权也不分词，
+            // 文件越长加载成本越接近常数（而不是先全量建好再 drain 丢掉）
+            let start = blocks.len().saturating_sub(self.max_entries);
             let mut store = self.store.write().unwrap();
-            for text in blocks {
-                let tokens = tokenize_lower(&text);
-                store.push((text, tokens));
+            for text in &blocks[start..] {
+                let tokens = tokenize_lower(text);
+                store.push((text.to_string(), tokens));
+            }
+        }
+    }
+
+    /// 批量写入多段文本：在内存中拼好全部块后一次 open + 一次 write 落盘，
+    /// 避免整理记忆等批处理路径上每块一次 open+write 系统调用
+    pub fn add_all<'a>(&self, texts: impl IntoIterator<Item = &'a str>) {
+        let mut buf = String::new();
+        {
+            let mut store = self.store.write().unwrap();
+            for text in texts {
+                let text = text.trim();
+                if text.is_empty() {
+                    continue;
+                }
+                let tokens = tokenize_lower(text);
+                store.push((text.to_string(), tokens));
+                let timestamp = chrono::Local::now().format("%Y-%m-%d %H:%M");
+                buf.push_str(&format!("\n\n## {}\n\n{}\n\n", timestamp, text));
             }
             let n = store.len();
             if n > self.max_entries {
                 store.drain(0..n - self.max_entries);
             }
         }
+        if buf.is_empty() {
+            return;
+        }
+        if let Some(p) = self.path.parent() {
+            let _ = std::fs::create_dir_all(p);
+        }
+        let _ = std::fs::OpenOptions::new()
+            .create(true)
+            .append(true)
+            .open(&self.path)
+            .and_then(|mut f| std::io::Write::write_all(&mut f, buf.as_bytes()));
     }
 
     /// BM25 风格得分：查询与文档词重叠数 / sqrt(文档长度)，用于排序检索结果
@@ -427,16 +478,25 @@ impl super::LongTermMemory for FileLongTerm {
             return Vec::new();
         }
         let store = self.store.read().unwrap();
-        let mut scored: Vec<(f64, String)> = store
+        // 打分阶段只记录索引，避免为每个候选克隆文本；仅 top-k 命中才克隆
+        let mut scored: Vec<(f64, usize)> = store
             .iter()
-            .map(|(text, doc_tokens)| {
+            .enumerate()
+            .map(|(i, (_, doc_tokens))| {
                 let s = Self::score(&query_tokens, doc_tokens, doc_tokens.len());
-                (s, text.clone())
+                (s, i)
             })
             .filter(|(s, _)| *s > 0.0)
             .collect();
+        // 只需要前 k 条：先线性选出 top-k 再排序，避免全量排序
+        if scored.len() > k && k > 0 {
+            scored.select_nth_unstable_by(k - 1, |a, b| {
+                b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal)
+            });
+            scored.truncate(k);
+        }
         scored.sort_by(|a, b| b.0.partial_cmp(&a.0).unwrap_or(std::cmp::Ordering::Equal));
-        scored.into_iter().take(k).map(|(_, t)| t).collect()
+        scored.into_iter().take(k).map(|(_, i)| store[i].0.clone()).collect()
     }
 
     fn enabled(&self) -> bool {
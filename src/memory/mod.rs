@@ -24,8 +24,8 @@ pub use markdown_store::{
     append_daily_log, append_lesson, append_preference, append_procedural, assistant_memory_root,
     consolidate_memory, daily_log_path, list_daily_logs_for_llm, load_lessons, load_preferences,
     load_procedural, append_heartbeat_log, heartbeat_log_path, long_term_path, lessons_path,
-    memory_root, preferences_path, procedural_path, vector_snapshot_path, ConsolidateResult,
-    FileLongTerm,
+    memory_root, preferences_path, procedural_path, today_str, vector_snapshot_path,
+    ConsolidateResult, FileLongTerm,
 };
 pub use learnings::{
     agents_path, learnings_root, promote_to_agents, promote_to_soul, promote_to_tools,
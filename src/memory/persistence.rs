@@ -18,8 +18,17 @@ impl ConversationPersistence {
         if !self.path.exists() {
             return Ok(Vec::new());
         }
-        let data = std::fs::read_to_string(&self.path)?;
-        let messages: Vec<SerMessage> = serde_json::from_str(&data)?;
+        // 直接按 bytes 读取并解析，省去 UTF-8 校验与 String 中转
+        let data = std::fs::read(&self.path)?;
+        // 兼容两种格式：旧版 JSON 数组快照，以及 append() 产生的 JSONL（每行一条消息）
+        let messages: Vec<SerMessage> = if starts_with_array(&data) {
+            serde_json::from_slice(&data)?
+        } else {
+            data.split(|&b| b == b'\n')
+                .filter(|line| !line.iter().all(u8::is_ascii_whitespace))
+                .filter_map(|line| serde_json::from_slice(line).ok())
+                .collect()
+        };
         Ok(messages
             .into_iter()
             .map(|m| Message {
@@ -33,34 +42,76 @@ impl ConversationPersistence {
             .collect())
     }
 
-    pub fn save(&self, messages: &[Message]) -> anyhow::Result<()> {
+    /// 追加单条消息（JSONL，每行一条）：消息一旦写入不可变，
+    /// 逐条追加把每轮写入成本从 O(历史总量) 降到 O(1)
+    pub fn append(&self, message: &Message) -> anyhow::Result<()> {
+        use std::io::Write;
+
         if let Some(parent) = self.path.parent() {
             std::fs::create_dir_all(parent)?;
         }
-        let ser: Vec<SerMessage> = messages
-            .iter()
-            .map(|m| SerMessage {
-                role: match m.role {
-                    Role::User => "user",
-                    Role::Assistant => "assistant",
-                    Role::System => "system",
-                    Role::Tool => "tool",
+        // 若已有旧版数组格式快照，先整体转写为 JSONL，之后保持追加
+        if self.path.exists() {
+            let data = std::fs::read(&self.path)?;
+            if starts_with_array(&data) {
+                let existing = self.load()?;
+                let mut buf = Vec::new();
+                for m in &existing {
+                    serde_json::to_writer(&mut buf, &SerMessageRef::from(m))?;
+                    buf.push(b'\n');
                 }
-                .to_string(),
-                content: m.content.clone(),
-            })
-            .collect();
-        std::fs::write(&self.path, serde_json::to_string_pretty(&ser)?)?;
+                std::fs::write(&self.path, buf)?;
+            }
+        }
+        let mut file = std::fs::OpenOptions::new()
+            .create(true)
+            .append(true)
+            .open(&self.path)?;
+        let mut line = serde_json::to_vec(&SerMessageRef::from(message))?;
+        line.push(b'\n');
+        file.write_all(&line)?;
+        Ok(())
+    }
+
+    pub fn save(&self, messages: &[Message]) -> anyhow::Result<()> {
+        if let Some(parent) = self.path.parent() {
+            std::fs::create_dir_all(parent)?;
+        }
+        let ser: Vec<SerMessageRef> = messages.iter().map(SerMessageRef::from).collect();
+        // 紧凑编码直接输出 bytes：快照由程序读取，省去 pretty 缩进与 String 中转
+        std::fs::write(&self.path, serde_json::to_vec(&ser)?)?;
         Ok(())
     }
 }
 
-#[derive(serde::Serialize, serde::Deserialize)]
+/// 首个非空白字节是否为 '['（旧版 JSON 数组格式）
+fn starts_with_array(data: &[u8]) -> bool {
+    data.iter().find(|b| !b.is_ascii_whitespace()) == Some(&b'[')
+}
+
+/// 反序列化用：load 时需要拥有字符串所有权
+#[derive(serde::Deserialize)]
 struct SerMessage {
     role: String,
     content: String,
 }
 
+/// 序列化用的借用视图：保存时直接借用消息内容，不为每条消息克隆 role/content
+#[derive(serde::Serialize)]
+struct SerMessageRef<'a> {
+    role: &'static str,
+    content: &'a str,
+}
+
+impl<'a> From<&'a Message> for SerMessageRef<'a> {
+    fn from(m: &'a Message) -> Self {
+        Self {
+            role: m.role.as_str(),
+            content: &m.content,
+        }
+    }
+}
+
 use rusqlite::{params, Connection, Result as SqliteResult};
 use chrono::Utc;
 
@@ -71,6 +122,17 @@ pub struct SqlitePersistence {
 impl SqlitePersistence {
     pub fn new(db_path: impl AsRef<Path>) -> anyhow::Result<Self> {
         let conn = Connection::open(db_path)?;
+        // WAL 模式下写不阻塞读、fsync 移出提交关键路径；synchronous=NORMAL 在 WAL
+        // 下依旧保证崩溃一致性（最多丢最近一次 checkpoint 后的事务），写延迟显著下降
+        conn.execute_batch(
+            "PRAGMA journal_mode=WAL;
+             PRAGMA synchronous=NORMAL;
+             PRAGMA temp_store=MEMORY;
+             PRAGMA mmap_size=268435456;
+             PRAGMA cache_size=-65536;",
+        )?;
+        // 热路径语句走 prepare_cached，避免每次调用重新 tokenize/parse/plan SQL
+        conn.set_prepared_statement_cache_capacity(256);
         let persistence = Self { conn };
         persistence.init_tables()?;
         Ok(persistence)
@@ -121,37 +183,58 @@ impl SqlitePersistence {
 
     pub fn create_session(&self, session_id: &str, title: Option<&str>) -> SqliteResult<()> {
         let now = Utc::now().to_rfc3339();
-        self.conn.execute(
-            "INSERT OR REPLACE INTO sessions (id, created_at, updated_at, title) VALUES (?1, ?2, ?3, ?4)",
-            params![session_id, now, now, title],
-        )?;
+        self.conn
+            .prepare_cached(
+                "INSERT OR REPLACE INTO sessions (id, created_at, updated_at, title) VALUES (?1, ?2, ?3, ?4)",
+            )?
+            .execute(params![session_id, now, now, title])?;
         Ok(())
     }
 
     pub fn save_message(&self, session_id: &str, message: &Message) -> SqliteResult<()> {
-        let role_str = match message.role {
-            Role::User => "user",
-            Role::Assistant => "assistant",
-            Role::System => "system",
-            Role::Tool => "tool",
-        };
+        let role_str = message.role.as_str();
         let now = Utc::now().to_rfc3339();
-        
-        self.conn.execute(
+
+        // INSERT 与 updated_at 更新合并为一个事务：单条消息只 commit/fsync 一次
+        let tx = self.conn.unchecked_transaction()?;
+        tx.prepare_cached(
             "INSERT INTO messages (session_id, role, content, created_at) VALUES (?1, ?2, ?3, ?4)",
-            params![session_id, role_str, message.content, now],
-        )?;
-        
-        self.conn.execute(
+        )?
+        .execute(params![session_id, role_str, message.content, now])?;
+
+        tx.prepare_cached("UPDATE sessions SET updated_at = ?1 WHERE id = ?2")?
+            .execute(params![now, session_id])?;
+        tx.commit()?;
+
+        Ok(())
+    }
+
+    /// 批量保存多条消息：整批包在一个事务里，一次 commit。
+    /// 逐条 save_message 每次都是独立的自动提交事务，吞吐受限于磁盘每秒事务数；
+    /// 单事务批量写入时 SQLite 可以达到数万行/秒。
+    pub fn save_messages(&mut self, session_id: &str, messages: &[Message]) -> SqliteResult<()> {
+        if messages.is_empty() {
+            return Ok(());
+        }
+        let now = Utc::now().to_rfc3339();
+        let tx = self.conn.transaction()?;
+        {
+            let mut stmt = tx.prepare_cached(
+                "INSERT INTO messages (session_id, role, content, created_at) VALUES (?1, ?2, ?3, ?4)",
+            )?;
+            for message in messages {
+                stmt.execute(params![session_id, message.role.as_str(), message.content, now])?;
+            }
+        }
+        tx.execute(
             "UPDATE sessions SET updated_at = ?1 WHERE id = ?2",
             params![now, session_id],
         )?;
-        
-        Ok(())
+        tx.commit()
     }
 
     pub fn load_messages(&self, session_id: &str) -> SqliteResult<Vec<Message>> {
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT role, content FROM messages WHERE session_id = ?1 ORDER BY id ASC"
         )?;
         
@@ -171,15 +254,16 @@ impl SqlitePersistence {
 
     pub fn save_checkpoint(&self, session_id: &str, step: i32, state: &str) -> SqliteResult<()> {
         let now = Utc::now().to_rfc3339();
-        self.conn.execute(
-            "INSERT INTO checkpoints (session_id, step, state, created_at) VALUES (?1, ?2, ?3, ?4)",
-            params![session_id, step, state, now],
-        )?;
+        self.conn
+            .prepare_cached(
+                "INSERT INTO checkpoints (session_id, step, state, created_at) VALUES (?1, ?2, ?3, ?4)",
+            )?
+            .execute(params![session_id, step, state, now])?;
         Ok(())
     }
 
     pub fn load_latest_checkpoint(&self, session_id: &str) -> SqliteResult<Option<(i32, String)>> {
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT step, state FROM checkpoints WHERE session_id = ?1 ORDER BY id DESC LIMIT 1"
         )?;
         
@@ -173,8 +173,9 @@ pub struct RetrievalResult {
 
 /// 向量存储
 pub struct VectorStore {
-    /// (chunk_id, chunk, embedding)
-    entries: Vec<(String, Chunk, Vec<f32>)>,
+    /// (chunk_id, chunk, embedding, 分词集合)；分词在 add 时算好，
+    /// hybrid_search 每次查询不再对全部块重新分词
+    entries: Vec<(String, Chunk, Vec<f32>, std::collections::HashSet<String>)>,
     /// 嵌入提供者
     embedder: Arc<dyn EmbeddingProvider>,
     /// 最大条目数
@@ -198,7 +199,8 @@ impl VectorStore {
         }
         
         let id = chunk.id.clone();
-        self.entries.push((id, chunk, embedding));
+        let tokens = tokenizer::tokenize_to_set(&chunk.text);
+        self.entries.push((id, chunk, embedding, tokens));
 
         // 超出限制时移除最旧的
         if self.entries.len() > self.max_entries {
@@ -229,7 +231,7 @@ impl VectorStore {
         let mut scored: Vec<(f32, &Chunk)> = self
             .entries
             .iter()
-            .map(|(_, chunk, emb)| (cosine_similarity(&query_embedding, emb), chunk))
+            .map(|(_, chunk, emb, _)| (cosine_similarity(&query_embedding, emb), chunk))
             .filter(|(score, _)| *score > 0.0)
             .collect();
 
@@ -255,9 +257,8 @@ impl VectorStore {
         let mut keyword_scored: Vec<(f32, &Chunk)> = self
             .entries
             .iter()
-            .map(|(_, chunk, _)| {
-                let chunk_tokens = tokenizer::tokenize_to_set(&chunk.text);
-                let score = tokenizer::jaccard_similarity(&query_tokens, &chunk_tokens);
+            .map(|(_, chunk, _, chunk_tokens)| {
+                let score = tokenizer::jaccard_similarity(&query_tokens, chunk_tokens);
                 (score, chunk)
             })
             .filter(|(score, _)| *score > 0.0)
@@ -285,8 +286,8 @@ impl VectorStore {
             .filter_map(|(id, score)| {
                 self.entries
                     .iter()
-                    .find(|(entry_id, _, _)| entry_id == &id)
-                    .map(|(_, chunk, _)| RetrievalResult {
+                    .find(|(entry_id, _, _, _)| entry_id == &id)
+                    .map(|(_, chunk, _, _)| RetrievalResult {
                         chunk: chunk.clone(),
                         score,
                     })
@@ -301,7 +302,7 @@ impl VectorStore {
 
     /// 删除指定来源的所有块
     pub fn remove_by_source(&mut self, source_id: &str) {
-        self.entries.retain(|(_, chunk, _)| chunk.source_id != source_id);
+        self.entries.retain(|(_, chunk, _, _)| chunk.source_id != source_id);
     }
 
     /// 获取存储条目数
@@ -64,9 +64,9 @@ impl MemorySegment {
         }
     }
 
-    /// 所有记忆段类型
-    pub fn all() -> Vec<Self> {
-        vec![
+    /// 所有记忆段类型（静态表，已按优先级排好序，避免每次调用分配新 Vec）
+    pub fn all() -> &'static [Self] {
+        const ALL: [MemorySegment; 7] = [
             MemorySegment::SystemPrompt,
             MemorySegment::ToolSchema,
             MemorySegment::WorkingMemory,
@@ -74,7 +74,8 @@ impl MemorySegment {
             MemorySegment::Lessons,
             MemorySegment::Procedural,
             MemorySegment::LongTerm,
-        ]
+        ];
+        &ALL
     }
 }
 
@@ -123,22 +124,23 @@ impl TokenBudget {
         let mut result = Vec::new();
         let mut remaining = self.system_prompt_budget();
 
-        // 按优先级排序
-        let mut sorted: Vec<_> = segments.to_vec();
-        sorted.sort_by_key(|(seg, _)| seg.priority());
+        // 只排序索引：优先级是段落的静态属性，无需克隆各段内容再整体排序
+        let mut order: Vec<usize> = (0..segments.len()).collect();
+        order.sort_by_key(|&i| segments[i].0.priority());
 
-        for (segment, content) in sorted {
+        for i in order {
+            let (segment, ref content) = segments[i];
             if content.is_empty() {
                 continue;
             }
 
-            let estimated_tokens = TokenEstimator::estimate(&content);
+            let estimated_tokens = TokenEstimator::estimate(content);
             let segment_limit = self.segment_limits.get(&segment).copied()
                 .unwrap_or(remaining);
             let allowed = remaining.min(segment_limit);
 
             if estimated_tokens <= allowed {
-                result.push((segment, content));
+                result.push((segment, content.clone()));
                 remaining = remaining.saturating_sub(estimated_tokens);
             } else if allowed > 0 {
                 // 需要截断
@@ -86,15 +86,22 @@ impl UserMemoryManager {
     }
 
     /// 为用户添加记忆
+    ///
+    /// add/search 底层会同步调用 embedding（阻塞 HTTP）与文件 IO，
+    /// 放到阻塞线程池执行，避免卡住 tokio 工作线程拖慢整个网关
     pub async fn add(&self, user_id: &str, text: &str) {
         let memory = self.get_or_create(user_id).await;
-        memory.add(text);
+        let text = text.to_string();
+        let _ = tokio::task::spawn_blocking(move || memory.add(&text)).await;
     }
 
     /// 为用户搜索记忆
     pub async fn search(&self, user_id: &str, query: &str, k: usize) -> Vec<String> {
         let memory = self.get_or_create(user_id).await;
-        memory.search(query, k)
+        let query = query.to_string();
+        tokio::task::spawn_blocking(move || memory.search(&query, k))
+            .await
+            .unwrap_or_default()
     }
 
     /// 刷新所有用户的记忆到磁盘
@@ -63,6 +63,7 @@ impl Metrics {
 
     /// 导出为 JSON 格式
     pub fn to_json(&self) -> serde_json::Value {
+        let behavior = self.behavior.snapshot();
         serde_json::json!({
             "llm": {
                 "total_calls": self.llm.total_calls.load(Ordering::Relaxed),
@@ -86,116 +87,67 @@ impl Metrics {
                 "active_sessions": self.session.active_sessions.load(Ordering::Relaxed),
             },
             "behavior": {
-                "intent_misunderstandings": self.behavior.intent_misunderstandings.load(Ordering::Relaxed),
-                "tool_misuses": self.behavior.tool_misuses.load(Ordering::Relaxed),
-                "path_errors": self.behavior.path_errors.load(Ordering::Relaxed),
-                "output_issues": self.behavior.output_issues.load(Ordering::Relaxed),
-                "user_corrections": self.behavior.user_corrections.load(Ordering::Relaxed),
-                "total_errors": self.behavior.total_errors(),
-                "tasks_completed_first_try": self.behavior.tasks_completed_first_try.load(Ordering::Relaxed),
-                "tasks_total": self.behavior.tasks_total.load(Ordering::Relaxed),
-                "completion_rate": self.behavior.completion_rate(),
-                "error_rate": self.behavior.error_rate(),
+                "intent_misunderstandings": behavior.intent_misunderstandings,
+                "tool_misuses": behavior.tool_misuses,
+                "path_errors": behavior.path_errors,
+                "output_issues": behavior.output_issues,
+                "user_corrections": behavior.user_corrections,
+                "total_errors": behavior.total_errors(),
+                "tasks_completed_first_try": behavior.tasks_completed_first_try,
+                "tasks_total": behavior.tasks_total,
+                "completion_rate": behavior.completion_rate(),
+                "error_rate": behavior.error_rate(),
             }
         })
     }
 
     /// 导出为 Prometheus 格式
     pub fn to_prometheus(&self) -> String {
-        let mut output = String::new();
-        
-        // LLM metrics
-        output.push_str(&format!(
-            "# TYPE bee_llm_calls_total counter\nbee_llm_calls_total {}\n",
-            self.llm.total_calls.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_llm_calls_success counter\nbee_llm_calls_success {}\n",
-            self.llm.successful_calls.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_llm_calls_failure counter\nbee_llm_calls_failure {}\n",
-            self.llm.failed_calls.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_llm_prompt_tokens_total counter\nbee_llm_prompt_tokens_total {}\n",
-            self.llm.total_prompt_tokens.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_llm_completion_tokens_total counter\nbee_llm_completion_tokens_total {}\n",
-            self.llm.total_completion_tokens.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_llm_latency_ms_total counter\nbee_llm_latency_ms_total {}\n",
-            self.llm.total_latency_ms.load(Ordering::Relaxed)
-        ));
-        
-        // Tool metrics
-        output.push_str(&format!(
-            "# TYPE bee_tool_executions_total counter\nbee_tool_executions_total {}\n",
-            self.tools.total_executions.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_tool_executions_success counter\nbee_tool_executions_success {}\n",
-            self.tools.successful_executions.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_tool_executions_failure counter\nbee_tool_executions_failure {}\n",
-            self.tools.failed_executions.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_tool_execution_time_ms_total counter\nbee_tool_execution_time_ms_total {}\n",
-            self.tools.total_execution_time_ms.load(Ordering::Relaxed)
-        ));
-        
-        // Session metrics
-        output.push_str(&format!(
-            "# TYPE bee_session_requests_total counter\nbee_session_requests_total {}\n",
-            self.session.total_requests.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_session_active_sessions gauge\nbee_session_active_sessions {}\n",
-            self.session.active_sessions.load(Ordering::Relaxed)
-        ));
-
-        // Behavior metrics
-        output.push_str(&format!(
-            "# TYPE bee_behavior_intent_misunderstandings counter\nbee_behavior_intent_misunderstandings {}\n",
-            self.behavior.intent_misunderstandings.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_tool_misuses counter\nbee_behavior_tool_misuses {}\n",
-            self.behavior.tool_misuses.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_path_errors counter\nbee_behavior_path_errors {}\n",
-            self.behavior.path_errors.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_output_issues counter\nbee_behavior_output_issues {}\n",
-            self.behavior.output_issues.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_user_corrections counter\nbee_behavior_user_corrections {}\n",
-            self.behavior.user_corrections.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_tasks_total counter\nbee_behavior_tasks_total {}\n",
-            self.behavior.tasks_total.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_tasks_completed_first_try counter\nbee_behavior_tasks_completed_first_try {}\n",
-            self.behavior.tasks_completed_first_try.load(Ordering::Relaxed)
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_completion_rate gauge\nbee_behavior_completion_rate {}\n",
-            self.behavior.completion_rate()
-        ));
-        output.push_str(&format!(
-            "# TYPE bee_behavior_error_rate gauge\nbee_behavior_error_rate {}\n",
-            self.behavior.error_rate()
-        ));
-        
+        use std::fmt::Write;
+
+        let behavior = self.behavior.snapshot();
+
+        // 指标表：行模板只写一处，新增指标只需在表里加一行
+        let counters: [(&str, u64); 18] = [
+            ("bee_llm_calls_total", self.llm.total_calls.load(Ordering::Relaxed)),
+            ("bee_llm_calls_success", self.llm.successful_calls.load(Ordering::Relaxed)),
+            ("bee_llm_calls_failure", self.llm.failed_calls.load(Ordering::Relaxed)),
+            ("bee_llm_prompt_tokens_total", self.llm.total_prompt_tokens.load(Ordering::Relaxed)),
+            ("bee_llm_completion_tokens_total", self.llm.total_completion_tokens.load(Ordering::Relaxed)),
+            ("bee_llm_latency_ms_total", self.llm.total_latency_ms.load(Ordering::Relaxed)),
+            ("bee_tool_executions_total", self.tools.total_executions.load(Ordering::Relaxed)),
+            ("bee_tool_executions_success", self.tools.successful_executions.load(Ordering::Relaxed)),
+            ("bee_tool_executions_failure", self.tools.failed_executions.load(Ordering::Relaxed)),
+            ("bee_tool_execution_time_ms_total", self.tools.total_execution_time_ms.load(Ordering::Relaxed)),
+            ("bee_session_requests_total", self.session.total_requests.load(Ordering::Relaxed)),
+            ("bee_behavior_intent_misunderstandings", behavior.intent_misunderstandings),
+            ("bee_behavior_tool_misuses", behavior.tool_misuses),
+            ("bee_behavior_path_errors", behavior.path_errors),
+            ("bee_behavior_output_issues", behavior.output_issues),
+            ("bee_behavior_user_corrections", behavior.user_corrections),
+            ("bee_behavior_tasks_total", behavior.tasks_total),
+            ("bee_behavior_tasks_completed_first_try", behavior.tasks_completed_first_try),
+        ];
+        let gauges_u64: [(&str, u64); 1] = [
+            ("bee_session_active_sessions", self.session.active_sessions.load(Ordering::Relaxed)),
+        ];
+        let gauges_f64: [(&str, f64); 2] = [
+            ("bee_behavior_completion_rate", behavior.completion_rate()),
+            ("bee_behavior_error_rate", behavior.error_rate()),
+        ];
+
+        // 预分配足够容量并用 write! 原地格式化，避免每行一次 format! 临时分配
+        let mut output = String::with_capacity(2048);
+        for (name, value) in counters {
+            let _ = write!(output, "# TYPE {0} counter\n{0} {1}\n", name, value);
+        }
+        for (name, value) in gauges_u64 {
+            let _ = write!(output, "# TYPE {0} gauge\n{0} {1}\n", name, value);
+        }
+        for (name, value) in gauges_f64 {
+            let _ = write!(output, "# TYPE {0} gauge\n{0} {1}\n", name, value);
+        }
+
         output
     }
 }
@@ -224,6 +176,8 @@ impl LlmMetrics {
         self.total_completion_tokens.fetch_add(completion_tokens, Ordering::Relaxed);
     }
 
+    /// 平均延迟由累计和/计数在读取时推导；不要改成存平均值再按
+    /// `avg * (n-1)` 反推更新——那会在长会话里累积浮点误差
     pub fn average_latency_ms(&self) -> f64 {
         let total = self.total_latency_ms.load(Ordering::Relaxed);
         let count = self.total_calls.load(Ordering::Relaxed);
@@ -316,7 +270,58 @@ pub struct BehaviorMetrics {
     pub tasks_total: AtomicU64,
 }
 
+/// 行为指标快照：每个计数器只 load 一次，派生率直接由快照值计算，
+/// 避免导出时 total_errors / error_rate 等反复重读原子计数器
+#[derive(Debug, Clone, Copy)]
+pub struct BehaviorSnapshot {
+    pub intent_misunderstandings: u64,
+    pub tool_misuses: u64,
+    pub path_errors: u64,
+    pub output_issues: u64,
+    pub user_corrections: u64,
+    pub tasks_completed_first_try: u64,
+    pub tasks_total: u64,
+}
+
+impl BehaviorSnapshot {
+    /// 总错误数（快照内求和，不再访问原子）
+    pub fn total_errors(&self) -> u64 {
+        self.intent_misunderstandings + self.tool_misuses + self.path_errors + self.output_issues
+    }
+
+    /// 任务完成率
+    pub fn completion_rate(&self) -> f64 {
+        if self.tasks_total == 0 {
+            0.0
+        } else {
+            self.tasks_completed_first_try as f64 / self.tasks_total as f64
+        }
+    }
+
+    /// 错误率（相对于总任务数）
+    pub fn error_rate(&self) -> f64 {
+        if self.tasks_total == 0 {
+            0.0
+        } else {
+            self.total_errors() as f64 / self.tasks_total as f64
+        }
+    }
+}
+
 impl BehaviorMetrics {
+    /// 取一次一致性快照，供导出/聚合使用
+    pub fn snapshot(&self) -> BehaviorSnapshot {
+        BehaviorSnapshot {
+            intent_misunderstandings: self.intent_misunderstandings.load(Ordering::Relaxed),
+            tool_misuses: self.tool_misuses.load(Ordering::Relaxed),
+            path_errors: self.path_errors.load(Ordering::Relaxed),
+            output_issues: self.output_issues.load(Ordering::Relaxed),
+            user_corrections: self.user_corrections.load(Ordering::Relaxed),
+            tasks_completed_first_try: self.tasks_completed_first_try.load(Ordering::Relaxed),
+            tasks_total: self.tasks_total.load(Ordering::Relaxed),
+        }
+    }
+
     /// 记录意图误解
     pub fn record_intent_misunderstanding(&self) {
         self.intent_misunderstandings.fetch_add(1, Ordering::Relaxed);
@@ -342,6 +347,22 @@ impl BehaviorMetrics {
         self.user_corrections.fetch_add(1, Ordering::Relaxed);
     }
 
+    /// 按错误类型名记录一次错误（供上报接口等以字符串携带类型的调用方使用）。
+    /// 用 match 做表驱动分发，替代调用方逐个 if/else 比较字符串再挑选 record_* 方法；
+    /// 未知类型返回 false，由调用方决定如何上报。
+    pub fn record_error_type(&self, error_type: &str) -> bool {
+        let counter = match error_type {
+            "intent_misunderstanding" | "意图误解" => &self.intent_misunderstandings,
+            "tool_misuse" | "工具误用" => &self.tool_misuses,
+            "path_error" | "路径错误" => &self.path_errors,
+            "output_issue" | "输出不当" => &self.output_issues,
+            "user_correction" | "用户纠正" => &self.user_corrections,
+            _ => return false,
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
+        true
+    }
+
     /// 记录任务完成情况
     pub fn record_task(&self, completed_first_try: bool) {
         self.tasks_total.fetch_add(1, Ordering::Relaxed);
@@ -509,6 +530,19 @@ mod tests {
         assert_eq!(metrics.total_errors(), 4);
     }
 
+    #[test]
+    fn test_behavior_record_error_type() {
+        let metrics = BehaviorMetrics::default();
+
+        assert!(metrics.record_error_type("tool_misuse"));
+        assert!(metrics.record_error_type("意图误解"));
+        assert!(!metrics.record_error_type("unknown"));
+
+        assert_eq!(metrics.tool_misuses.load(Ordering::Relaxed), 1);
+        assert_eq!(metrics.intent_misunderstandings.load(Ordering::Relaxed), 1);
+        assert_eq!(metrics.total_errors(), 2);
+    }
+
     #[test]
     fn test_behavior_metrics_completion_rate() {
         let metrics = BehaviorMetrics::default();
@@ -232,18 +232,19 @@ impl Tool for CodeGrepTool {
         output.push_str(&"=".repeat(60));
         output.push('\n');
 
+        // write! 直接写入输出缓冲，匹配行不再经过临时 String 与截断副本
+        use std::fmt::Write as _;
         for result in results {
-            output.push_str(&format!("\n{}:\n", result.file_path.display()));
+            let _ = writeln!(output, "\n{}:", result.file_path.display());
             for (line_num, line) in result.matches.iter().take(10) {
-                let truncated = if line.len() > 100 {
-                    format!("{}...", &line[..100])
+                if line.len() > 100 {
+                    let _ = writeln!(output, "  {:4}: {}...", line_num, &line[..100]);
                 } else {
-                    line.clone()
-                };
-                output.push_str(&format!("  {:4}: {}\n", line_num, truncated));
+                    let _ = writeln!(output, "  {:4}: {}", line_num, line);
+                }
             }
             if result.matches.len() > 10 {
-                output.push_str(&format!("  ... ({} more matches)\n", result.matches.len() - 10));
+                let _ = writeln!(output, "  ... ({} more matches)", result.matches.len() - 10);
             }
         }
 
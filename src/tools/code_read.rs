@@ -107,14 +107,15 @@ impl CodeReadTool {
         result.push_str(&"-".repeat(60));
         result.push('\n');
 
+        // write! 直接写入结果缓冲：每行省去 format! 的临时 String 与截断副本
+        use std::fmt::Write as _;
         for (i, line) in slice.iter().enumerate() {
             let line_num = offset + i + 1;
-            let truncated = if line.len() > self.max_line_length {
-                format!("{}...", &line[..self.max_line_length])
+            if line.len() > self.max_line_length {
+                let _ = writeln!(result, "{:4}: {}...", line_num, &line[..self.max_line_length]);
             } else {
-                line.to_string()
-            };
-            result.push_str(&format!("{:4}: {}\n", line_num, truncated));
+                let _ = writeln!(result, "{:4}: {}", line_num, line);
+            }
         }
 
         if end < total_lines {
@@ -1,5 +1,6 @@
 use std::collections::HashMap;
 use std::path::Path;
+use std::sync::OnceLock;
 
 use async_trait::async_trait;
 use regex::Regex;
@@ -62,6 +63,10 @@ impl CodeReviewTool {
     }
 
     fn analyze_rust(&self, content: &str, issues: &mut Vec<Issue>) {
+        // 文档检查用的正则只编译一次（每次 review 都会调用本函数）
+        static PUB_FN_RE: OnceLock<Regex> = OnceLock::new();
+        static PUB_STRUCT_RE: OnceLock<Regex> = OnceLock::new();
+
         let lines: Vec<&str> = content.lines().collect();
         let mut in_test_module = false;
         let mut bracket_depth = 0;
@@ -200,7 +205,8 @@ impl CodeReviewTool {
         
         let content_str = content.to_string();
         if content_str.contains("pub fn ") && !content_str.contains("///") && !content_str.contains("//!") {
-            let pub_fn_re = Regex::new(r"pub fn ([a-zA-Z_][a-zA-Z0-9_]*)").unwrap();
+            let pub_fn_re = PUB_FN_RE
+                .get_or_init(|| Regex::new(r"pub fn ([a-zA-Z_][a-zA-Z0-9_]*)").unwrap());
             for cap in pub_fn_re.captures_iter(&content_str) {
                 let fn_name = cap.get(1).unwrap().as_str();
                 let fn_pos = cap.get(0).unwrap().start();
@@ -224,7 +230,8 @@ impl CodeReviewTool {
         }
         
         if content_str.contains("pub struct ") && !content_str.contains("#![") {
-            let pub_struct_re = Regex::new(r"pub struct ([a-zA-Z_][a-zA-Z0-9_]*)").unwrap();
+            let pub_struct_re = PUB_STRUCT_RE
+                .get_or_init(|| Regex::new(r"pub struct ([a-zA-Z_][a-zA-Z0-9_]*)").unwrap());
             for cap in pub_struct_re.captures_iter(&content_str) {
                 let struct_name = cap.get(1).unwrap().as_str();
                 let struct_pos = cap.get(0).unwrap().start();
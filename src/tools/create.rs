@@ -48,10 +48,6 @@ impl CreateTool {
         self.workspace.join("groups.json")
     }
 
-    fn sessions_dir(&self) -> std::path::PathBuf {
-        self.workspace.join("sessions")
-    }
-
     fn load_agents(&self) -> Vec<DynamicAgent> {
         let data = match std::fs::read_to_string(self.agents_path()) {
             Ok(d) => d,
@@ -117,7 +113,8 @@ impl CreateTool {
                     id: group_id.clone(),
                     name: Some(format!("P2P {} ↔ {}", parent_id, id)),
                     member_ids: vec![parent_id.to_string(), id.clone()],
-                    created_at: chrono::Utc::now().to_rfc3339(),
+                    // 同一次创建复用上面的时间戳，省一次系统调用 + RFC3339 格式化
+                    created_at,
                 },
             );
             self.save_groups(&groups);
@@ -207,7 +204,7 @@ impl Tool for CreateTool {
                     id: group_id.clone(),
                     name: Some(format!("P2P {} ↔ {}", parent_id, id)),
                     member_ids: vec![parent_id.clone(), id.clone()],
-                    created_at: chrono::Utc::now().to_rfc3339(),
+                    created_at,
                 },
             );
             self.save_groups(&groups);
@@ -7,6 +7,65 @@ use crate::tools::Tool;
 use crate::llm::LlmClient;
 use crate::memory::Message;
 
+/// JSON 报告提示词的静态骨架（动态部分只有 topic / findings 两处）
+const JSON_PROMPT_HEAD: &str = "Generate a structured research report in JSON format.\n\nTopic: ";
+const JSON_PROMPT_TAIL: &str = r#"
+
+Output JSON structure:
+{
+    "title": "report title",
+    "executive_summary": "200-300 word summary",
+    "key_findings": ["finding 1", "finding 2"],
+    "methodology": "brief description",
+    "conclusions": ["conclusion 1", "conclusion 2"],
+    "recommendations": ["recommendation 1", "recommendation 2"],
+    "references": ["source 1", "source 2"]
+}"#;
+
+/// Markdown 报告提示词的静态骨架
+const MD_PROMPT_HEAD: &str = "Generate a comprehensive research report in Markdown format.\n\nTopic: ";
+const MD_PROMPT_TAIL: &str = r#"
+
+Format:
+# [Report Title]
+
+## Executive Summary
+[Brief overview]
+
+## Key Findings
+- Finding 1
+- Finding 2
+
+## Analysis
+[Detailed analysis]
+
+## Conclusions
+[Main conclusions]
+
+## Recommendations
+[Actionable recommendations]
+
+## References
+- Source 1
+- Source 2
+
+Report:"#;
+
+const FINDINGS_SEP: &str = "\n\nResearch Findings:\n";
+
+/// 静态骨架 + 动态字段按预估容量一次拼接，模板不再随每次调用整段重建
+fn assemble_prompt(head: &str, topic: &str, findings: &str, tail: &str) -> String {
+    let mut prompt = String::with_capacity(
+        head.len() + topic.len() + FINDINGS_SEP.len() + findings.len() + tail.len(),
+    );
+    prompt.push_str(head);
+    prompt.push_str(topic);
+    prompt.push_str(FINDINGS_SEP);
+    prompt.push_str(findings);
+    prompt.push_str(tail);
+    prompt
+}
+
 pub struct ReportGeneratorTool {
     llm: Arc<dyn LlmClient>,
 }
@@ -50,61 +109,9 @@ impl Tool for ReportGeneratorTool {
         }
 
         let prompt = if format == "json" {
-            format!(
-                r#"Generate a structured research report in JSON format.
-
-Topic: {}
-
-Research Findings:
-{}
-
-Output JSON structure:
-{{
-    "title": "report title",
-    "executive_summary": "200-300 word summary",
-    "key_findings": ["finding 1", "finding 2"],
-    "methodology": "brief description",
-    "conclusions": ["conclusion 1", "conclusion 2"],
-    "recommendations": ["recommendation 1", "recommendation 2"],
-    "references": ["source 1", "source 2"]
-}}"#,
-                topic, findings
-            )
+            assemble_prompt(JSON_PROMPT_HEAD, topic, findings, JSON_PROMPT_TAIL)
         } else {
-            format!(
-                r#"Generate a comprehensive research report in Markdown format.
-
-Topic: {}
-
-Research Findings:
-{}
-
-Format:
-# [Report Title]
-
-## Executive Summary
-[Brief overview]
-
-## Key Findings
-- Finding 1
-- Finding 2
-
-## Analysis
-[Detailed analysis]
-
-## Conclusions
-[Main conclusions]
-
-## Recommendations
-[Actionable recommendations]
-
-## References
-- Source 1
-- Source 2
-
-Report:"#,
-                topic, findings
-            )
+            assemble_prompt(MD_PROMPT_HEAD, topic, findings, MD_PROMPT_TAIL)
         };
 
         let messages = vec![Message::user(&prompt)];
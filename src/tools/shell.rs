@@ -49,6 +49,34 @@ impl ShellTool {
         raw.split_whitespace().next().unwrap_or("")
     }
 
+    /// 是否需要真正的 shell 解释：管道、重定向、变量展开、通配、引号等。
+    /// 不含这些元字符的简单命令可直接 exec，省掉 sh 这层额外的 fork+exec，
+    /// 也从根上杜绝对简单命令的注入解释
+    fn needs_shell(raw: &str) -> bool {
+        raw.bytes().any(|b| {
+            matches!(
+                b,
+                b'|' | b'&'
+                    | b';'
+                    | b'<'
+                    | b'>'
+                    | b'$'
+                    | b'`'
+                    | b'('
+                    | b')'
+                    | b'*'
+                    | b'?'
+                    | b'['
+                    | b'{'
+                    | b'~'
+                    | b'\''
+                    | b'"'
+                    | b'\\'
+                    | b'\n'
+            )
+        })
+    }
+
     fn is_allowed(&self, raw: &str) -> Result<(), String> {
         let raw_lower = raw.to_lowercase();
         for forbidden in FORBIDDEN_SUBSTR {
@@ -104,10 +132,16 @@ impl Tool for ShellTool {
             let mut c = Command::new("cmd");
             c.args(["/C", command]);
             c
-        } else {
+        } else if Self::needs_shell(command) {
             let mut c = Command::new("sh");
             c.args(["-c", command]);
             c
+        } else {
+            // 简单命令按空白切词直接 exec，不经过 sh
+            let mut tokens = command.split_whitespace();
+            let mut c = Command::new(tokens.next().unwrap_or(""));
+            c.args(tokens);
+            c
         };
 
         let output = tokio::time::timeout(
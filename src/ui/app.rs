@@ -15,7 +15,7 @@ use ratatui::{backend::CrosstermBackend, Terminal};
 use tokio::sync::watch;
 
 use crate::core::UiState;
-use crate::ui::render::{draw, InputFocus, InputState};
+use crate::ui::render::{draw, InputFocus, InputState, RenderCache};
 
 /// 默认智能体列表（TUI 用，与 config/assistants.toml 可扩展）
 const DEFAULT_AGENTS: &[&str] = &["默认", "自动分派"];
@@ -24,7 +24,7 @@ const DEFAULT_MODELS: &[&str] = &["默认", "DeepSeek", "GPT-4o", "Claude"];
 
 /// 运行 TUI：启用原始模式与全屏，循环 poll 事件 + 渲染，退出时恢复终端
 pub async fn run_app(
-    state_rx: watch::Receiver<UiState>,
+    mut state_rx: watch::Receiver<UiState>,
     _stream_rx: tokio::sync::broadcast::Receiver<String>,
     cmd_tx: tokio::sync::mpsc::UnboundedSender<crate::core::Command>,
 ) -> anyhow::Result<()> {
@@ -39,25 +39,29 @@ pub async fn run_app(
     let mut conversation_scroll = 0usize;
     let mut last_history_len = 0usize;
     let mut input_state = InputState::default();
+    let mut render_cache = RenderCache::default();
     let agents: Vec<&str> = DEFAULT_AGENTS.to_vec();
     let models: Vec<&str> = DEFAULT_MODELS.to_vec();
 
-    loop {
-        let state = state_rx.borrow().clone();
+    // 事件合并：仅在状态有更新或有按键时重绘。poll 本身最多阻塞 100ms，
+    // 空闲时不再每轮克隆整个 UiState（含全部历史）并全量重绘
+    let mut needs_redraw = true;
 
-        if state.history.len() != last_history_len {
-            last_history_len = state.history.len();
-            conversation_scroll = usize::MAX;
+    loop {
+        if state_rx.has_changed().unwrap_or(false) {
+            needs_redraw = true;
         }
+        let input_locked = state_rx.borrow().input_locked;
 
         if let Ok(Some(ev)) = event_handler.poll() {
+            needs_redraw = true;
             match ev {
                 super::event::AppEvent::Command(cmd) => {
                     if matches!(cmd, crate::core::Command::Quit) {
                         break;
                     }
                 }
-                super::event::AppEvent::Key(key) if !state.input_locked => {
+                super::event::AppEvent::Key(key) if !input_locked => {
                     match key.code {
                         KeyCode::Enter => {
                             if input_state.focus == InputFocus::Input
@@ -136,6 +140,17 @@ pub async fn run_app(
             }
         }
 
+        if !needs_redraw {
+            tokio::task::yield_now().await;
+            continue;
+        }
+        let state = state_rx.borrow_and_update().clone();
+
+        if state.history.len() != last_history_len {
+            last_history_len = state.history.len();
+            conversation_scroll = usize::MAX;
+        }
+
         let mut scroll_info = (0usize, 0usize);
         terminal.draw(|f| {
             draw(
@@ -147,11 +162,13 @@ pub async fn run_app(
                 &input_state,
                 &agents,
                 &models,
+                &mut render_cache,
             );
         })?;
         let (total_lines, viewport_height) = scroll_info;
         let max_scroll = total_lines.saturating_sub(viewport_height);
         conversation_scroll = conversation_scroll.min(max_scroll);
+        needs_redraw = false;
 
         tokio::task::yield_now().await;
     }
@@ -28,10 +28,13 @@ impl EventHandler {
 
     pub fn poll(&self) -> anyhow::Result<Option<AppEvent>> {
         if event::poll(std::time::Duration::from_millis(100))? {
-            if let Event::Key(key) = event::read()? {
-                if key.kind == KeyEventKind::Press {
+            match event::read()? {
+                Event::Key(key) if key.kind == KeyEventKind::Press => {
                     return Ok(Some(self.handle_key(key)));
                 }
+                Event::Key(_) => {}
+                // Resize 等非键盘事件也要触发重绘，否则缩放后界面停留在旧布局
+                _ => return Ok(Some(AppEvent::Tick)),
             }
         }
         Ok(None)
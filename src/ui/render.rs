@@ -62,6 +62,45 @@ fn truncate_for_display(content: &str) -> String {
     format!("{}\n... [结果已省略，共 {} 字]", head, chars.len())
 }
 
+/// 对话区换行缓存：历史消息一旦写入便不再变化（流式输出只会追加到最后一条），
+/// 因此按消息缓存截断+换行结果，每帧只重算内容有变化的条目，
+/// 而不是对整个历史做 O(总字符数) 的全量重排
+#[derive(Debug, Default)]
+pub struct RenderCache {
+    /// 缓存对应的内容宽度，宽度变化（终端缩放）时整体失效
+    width: usize,
+    /// 每条消息的 (原始内容, 换行后的行)；保存原文用于命中校验，
+    /// 仅比较长度无法区分 /clear 或裁剪后同下标、同长度的新消息
+    lines: Vec<(String, Vec<String>)>,
+}
+
+impl RenderCache {
+    /// 历史收缩（/clear、裁剪）后丢弃多余条目，避免旧内容残留被新消息复用
+    fn prune(&mut self, len: usize) {
+        self.lines.truncate(len);
+    }
+
+    /// 取第 idx 条消息的换行结果；命中则直接复用，未命中时重算并写回。
+    /// 命中判定比较原文本身（长度不同会立即短路，流式追加仍是快路径）
+    fn wrapped_lines(&mut self, idx: usize, content: &str, width: usize) -> &[String] {
+        if self.width != width {
+            self.width = width;
+            self.lines.clear();
+        }
+        if idx < self.lines.len() && self.lines[idx].0 == content {
+            return &self.lines[idx].1;
+        }
+        let wrapped = wrap_text(&truncate_for_display(content), width);
+        if idx < self.lines.len() {
+            self.lines[idx] = (content.to_string(), wrapped);
+        } else {
+            self.lines.truncate(idx);
+            self.lines.push((content.to_string(), wrapped));
+        }
+        &self.lines[idx].1
+    }
+}
+
 /// 将内容按宽度换行，支持 UTF-8（按字符数，避免在 UTF-8 中间截断）
 fn wrap_text(s: &str, width: usize) -> Vec<String> {
     if width == 0 {
@@ -70,11 +109,15 @@ fn wrap_text(s: &str, width: usize) -> Vec<String> {
     let mut lines = Vec::new();
     for para in s.split('\n') {
         let mut line = String::new();
+        // 维护计数器而非每个字符都 chars().count() 重扫整行（宽行会退化为 O(宽度²)）
+        let mut count = 0usize;
         for ch in para.chars() {
-            if line.chars().count() >= width {
+            if count >= width {
                 lines.push(std::mem::take(&mut line));
+                count = 0;
             }
             line.push(ch);
+            count += 1;
         }
         if !line.is_empty() {
             lines.push(line);
@@ -96,6 +139,7 @@ pub fn draw(
     input_state: &InputState,
     agents: &[&str],
     models: &[&str],
+    cache: &mut RenderCache,
 ) {
     // 输入区：主输入 5 行 + 工具栏 1 行
     let input_height = 6u16;
@@ -130,6 +174,7 @@ pub fn draw(
         .border_style(Style::default().fg(Color::Yellow));
 
     // 构建对话内容：每条消息先截断过长/工具结果，再按宽度换行；消息之间加空行分隔
+    cache.prune(state.history.len());
     let mut text_lines: Vec<Line> = Vec::new();
     for (idx, m) in state.history.iter().enumerate() {
         if idx > 0 {
@@ -141,13 +186,12 @@ pub fn draw(
             Role::System => ("Sys ", Color::Gray),
             Role::Tool => ("🔧  ", Color::Yellow),
         };
-        let display_text = truncate_for_display(&m.content);
-        let wrapped = wrap_text(&display_text, content_width.max(40));
-        for (i, line) in wrapped.into_iter().enumerate() {
+        let wrapped = cache.wrapped_lines(idx, &m.content, content_width.max(40));
+        for (i, line) in wrapped.iter().enumerate() {
             let pref = if i == 0 { prefix } else { "    " };
             text_lines.push(Line::from(vec![
                 Span::styled(pref, Style::default().fg(color).add_modifier(Modifier::BOLD)),
-                Span::raw(line),
+                Span::raw(line.clone()),
             ]));
         }
     }
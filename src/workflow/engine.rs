@@ -7,7 +7,6 @@ use std::sync::Arc;
 use tokio::sync::RwLock;
 use async_trait::async_trait;
 
-#[cfg(feature = "gateway")]
 use crate::gateway::{BackgroundTask, TaskQueue};
 use crate::workflow::types::*;
 use crate::workflow::graph::WorkflowGraph;
@@ -21,13 +20,11 @@ pub trait WorkflowTaskExecutor: Send + Sync {
 
 /// 工作流引擎
 pub struct WorkflowEngine {
-    #[cfg(feature = "gateway")]
     task_queue: Arc<TaskQueue>,
     workflows: RwLock<HashMap<WorkflowId, Workflow>>,
     executor: Arc<dyn WorkflowTaskExecutor>,
 }
 
-#[cfg(feature = "gateway")]
 impl WorkflowEngine {
     /// 创建新的工作流引擎
     pub fn new(
@@ -219,7 +216,6 @@ impl WorkflowEngine {
 mod tests {
     use super::*;
     use crate::workflow::WorkflowBuilder;
-    #[cfg(feature = "gateway")]
     use crate::gateway::{BackgroundTask, TaskQueue};
     use std::sync::Arc;
 
@@ -232,7 +228,6 @@ mod tests {
         }
     }
 
-    #[cfg(feature = "gateway")]
     #[tokio::test]
     async fn test_submit_workflow() {
         let (queue, _, _) = TaskQueue::new();
@@ -251,7 +246,6 @@ mod tests {
         assert!(!workflow_id.is_empty());
     }
 
-    #[cfg(feature = "gateway")]
     #[tokio::test]
     async fn test_sequential_execution() {
         let (queue, _, _) = TaskQueue::new();
@@ -1,9 +1,12 @@
 pub mod types;
 pub mod graph;
 pub mod builder;
+// 引擎依赖 gateway 的 BackgroundTask/TaskQueue，仅在该 feature 下编译
+#[cfg(feature = "gateway")]
 pub mod engine;
 
 pub use types::*;
 pub use graph::WorkflowGraph;
 pub use builder::WorkflowBuilder;
+#[cfg(feature = "gateway")]
 pub use engine::{WorkflowEngine, WorkflowTaskExecutor};